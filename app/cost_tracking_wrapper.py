@@ -7,6 +7,8 @@ from logging import getLogger
 from typing import Dict, Any, Callable, Optional
 from functools import wraps
 
+from app.middleware.cost_protection import WARN_BUDGET, send_json_message
+
 logger = getLogger("uvicorn.error")
 
 
@@ -63,7 +65,7 @@ def track_openai_call(
                     if (usage_result["session_cost"] >= budget_threshold_warning and
                         usage_result["budget_ok"]):
                         try:
-                            warning_task = websocket.send_json({
+                            warning_task = send_json_message(websocket, {
                                 "type": "budget_warning",
                                 "message": f"You have used {(usage_result['session_cost']/5.0)*100:.0f}% of your session budget",
                                 "session_cost": usage_result["session_cost"],
@@ -78,9 +80,9 @@ def track_openai_call(
                         logger.warning(f"Budget exceeded for session {session_id} in {func.__name__}")
                         try:
                             close_tasks = [
-                                websocket.send_json({
+                                send_json_message(websocket, {
                                     "type": "budget_exceeded",
-                                    "message": "Session budget limit exceeded",
+                                    "message": WARN_BUDGET,
                                     "session_cost": usage_result["session_cost"],
                                     "warnings": usage_result["warnings"]
                                 }),
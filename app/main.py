@@ -48,7 +48,8 @@ except ImportError:
 # Import cost protection middleware
 from app.middleware.cost_protection import (
     CostProtectionMiddleware,
-    get_cost_tracker
+    get_cost_tracker,
+    send_json_message
 )
 
 # Import rate limiting middleware
@@ -60,7 +61,7 @@ from app.middleware.rate_limiting import (
 from slowapi.errors import RateLimitExceeded
 
 # Import input validators and sanitizers
-from app.models.validators import LocationInput, SearchQuery, AcceptLanguage, FetchUrl
+from app.models.validators import LocationInput, SearchQuery, FetchUrl, validate_accept_language
 from app.security.sanitizers import sanitize_url_parameter, sanitize_api_response
 from pydantic import ValidationError
 from bs4 import BeautifulSoup
@@ -455,7 +456,7 @@ async def handle_media_stream(websocket: WebSocket):
     if cost_tracker.circuit_breaker_active:
         logger.warning(f"Circuit breaker active - rejecting session: {session_id}")
         try:
-            await websocket.send_json({
+            await send_json_message(websocket, {
                 "type": "service_unavailable",
                 "error": "System is currently under high load due to cost limits",
                 "message": "Please try again later",
@@ -512,9 +513,8 @@ async def handle_media_stream(websocket: WebSocket):
         # Validate accept-language header
         accept_language_raw = headers.get('accept-language', 'en-US')
         try:
-            validated_language = AcceptLanguage(language=accept_language_raw)
-            safe_language = validated_language.language
-        except ValidationError as e:
+            safe_language = validate_accept_language(accept_language_raw)
+        except ValueError as e:
             logger.warning(f"Invalid accept-language header: {accept_language_raw}, error: {e}")
             safe_language = "en-US"  # Fallback to safe default
 
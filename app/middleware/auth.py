@@ -264,8 +264,8 @@ def get_tier_limits(tier: str) -> Dict[str, Any]:
         Dict with rate_limit, session_budget, session_timeout
     """
     try:
-        tier_enum = UserTier(tier)
-        limits = TIER_CONFIGURATIONS[tier_enum]
+        # Keyed by str-enum members, so the tier string looks up directly
+        limits = TIER_CONFIGURATIONS[tier]
 
         return {
             "rate_limit": limits.rate_limit,
@@ -273,7 +273,7 @@ def get_tier_limits(tier: str) -> Dict[str, Any]:
             "session_timeout": limits.session_timeout,
             "websocket_connections": limits.websocket_connections
         }
-    except (ValueError, KeyError):
+    except (ValueError, KeyError, TypeError):
         # Invalid tier, return free tier limits
         logger.warning(f"Invalid tier requested: {tier}, returning free tier")
         limits = TIER_CONFIGURATIONS[UserTier.FREE]
@@ -4,14 +4,21 @@ Implements budget caps, session tracking, and circuit breaker for API costs
 """
 from fastapi import Request, HTTPException, WebSocket
 from fastapi.responses import JSONResponse
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from enum import IntEnum, IntFlag
 import asyncio
 import logging
+import time
 from pydantic import BaseModel, Field
 import json
 import os
+import re
+import sys
 
 # Optional redis import - only needed if REDIS_URL is configured
 try:
@@ -20,6 +27,23 @@ try:
 except ImportError:
     redis = None
     REDIS_AVAILABLE = False
+
+# orjson (declared in requirements.txt) encodes WebSocket budget messages;
+# the stdlib fallback sends the same frames
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional numpy import - vectorizes calculate_cost_batch when installed
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 from prometheus_client import Counter, Gauge, Histogram
 
 logger = logging.getLogger(__name__)
@@ -55,6 +79,184 @@ budget_exceeded = Counter(
 )
 
 
+class Model(IntEnum):
+    """Priced models, valued by their row in SessionCostTracker's price table"""
+    GPT5 = 0
+    GPT5_MINI = 1
+    GPT_REALTIME = 2
+
+
+# Model name -> price table row; any other model is billed at
+# FALLBACK_MODEL rates
+MODEL_PRICE_INDEX = {
+    "gpt-5": Model.GPT5,
+    "gpt-5-mini": Model.GPT5_MINI,
+    "gpt-realtime": Model.GPT_REALTIME,
+}
+FALLBACK_MODEL = "gpt-5-mini"
+
+# Lookup accepting either a model name or a Model member
+_MODEL_ROWS: Dict[Union[str, Model], Model] = {
+    **MODEL_PRICE_INDEX,
+    **{model: model for model in Model},
+}
+
+# Dated snapshot suffix, e.g. gpt-5-2025-08-07
+_MODEL_DATE_SUFFIX_RE = re.compile(r'-\d{4}-\d{2}-\d{2}$')
+
+
+def normalize_model(model: str) -> str:
+    """
+    Reduce a model id to its MODEL_PRICE_INDEX key
+
+    Lowercases, drops a provider prefix (openai/gpt-5) and a dated
+    snapshot suffix (gpt-5-2025-08-07).
+
+    Args:
+        model: Model id as reported by the caller
+
+    Returns:
+        Canonical model name (unknown models pass through normalized)
+    """
+    model = model.strip().lower().rpartition("/")[2]
+    return _MODEL_DATE_SUFFIX_RE.sub("", model)
+
+
+def _price_row(model: Union[str, Model]) -> Optional[Model]:
+    """Price table row for a model, or None if it is not priced"""
+    row = _MODEL_ROWS.get(model)
+    if row is None and isinstance(model, str):
+        row = MODEL_PRICE_INDEX.get(normalize_model(model))
+    return row
+
+
+async def send_json_message(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """
+    Send a JSON message over a WebSocket as a text frame
+
+    Same wire format as websocket.send_json (compact separators, UTF-8),
+    encoded by orjson when installed. Only floats written in exponent
+    form differ (orjson 0.000015, json 1.5e-05), and both parse to the
+    same value. Text rather than bytes, because the browser client parses
+    budget messages as strings.
+
+    Args:
+        websocket: Connected WebSocket
+        payload: JSON-serializable message
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            await websocket.send_text(orjson.dumps(payload).decode())
+            return
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits)
+            pass
+
+    await websocket.send_text(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+
+
+class WarningFlags(IntFlag):
+    """Budget conditions reported by SessionCostTracker.check_budget"""
+    BUDGET_EXCEEDED = 1
+    DURATION_EXCEEDED = 2
+    CIRCUIT_BREAKER_ACTIVE = 4
+
+
+# Warning messages, interned so membership checks against results hit
+# the identity fast path
+WARN_BUDGET = sys.intern("Session budget limit exceeded")
+WARN_DURATION = sys.intern("Session duration limit exceeded")
+WARN_CIRCUIT_BREAKER = sys.intern("System-wide circuit breaker is active")
+
+_WARNING_MESSAGES = (
+    (WarningFlags.BUDGET_EXCEEDED, WARN_BUDGET),
+    (WarningFlags.DURATION_EXCEEDED, WARN_DURATION),
+    (WarningFlags.CIRCUIT_BREAKER_ACTIVE, WARN_CIRCUIT_BREAKER),
+)
+
+# Warning messages for every mask value, so results never build a list
+_WARNINGS_BY_MASK: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(message for flag, message in _WARNING_MESSAGES if mask & flag)
+    for mask in range(1 << len(_WARNING_MESSAGES))
+)
+
+
+class _KeyAccess(Mapping):
+    """
+    Read-only mapping view of result records (result["budget_ok"])
+
+    Supports `in`, dict(result) and {**result} like the dicts these
+    records replaced; json.dumps needs to_dict().
+    """
+    __slots__ = ()
+
+    # Properties readable by key alongside the dataclass fields
+    _derived_keys: ClassVar[Tuple[str, ...]] = ("warnings",)
+
+    def _has_key(self, key: str) -> bool:
+        return key in self.__dataclass_fields__ or key in self._derived_keys
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._has_key(key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._has_key(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.__dataclass_fields__
+        yield from self._derived_keys
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__) + len(self._derived_keys)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if self._has_key(key) else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {f.name: getattr(self, f.name) for f in fields(self)}
+        for key in self._derived_keys:
+            result[key] = getattr(self, key)
+        return result
+
+    @property
+    def flags(self) -> WarningFlags:
+        """Warning conditions as a WarningFlags value"""
+        return WarningFlags(self.warnings_mask)
+
+    @property
+    def warnings(self) -> Tuple[str, ...]:
+        """Human-readable warning messages (empty when within budget)"""
+        return _WARNINGS_BY_MASK[self.warnings_mask]
+
+
+@dataclass(slots=True)
+class BudgetStatus(_KeyAccess):
+    """Result of SessionCostTracker.check_budget"""
+    budget_ok: bool
+    remaining_budget_usd: float
+    remaining_duration_seconds: float
+    circuit_breaker_active: bool
+    warnings_mask: int
+
+
+@dataclass(slots=True)
+class UsageResult(_KeyAccess):
+    """Result of SessionCostTracker.track_usage: the call's cost plus budget status"""
+    session_id: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    call_cost: float
+    session_cost: float
+    budget_ok: bool
+    remaining_budget_usd: float
+    remaining_duration_seconds: float
+    circuit_breaker_active: bool
+    warnings_mask: int
+
+
 class CostProtectionConfig(BaseModel):
     """Cost protection configuration with validation"""
     enabled: bool = Field(
@@ -116,6 +318,9 @@ class SessionCostTracker:
     Supports both in-memory and Redis-backed storage
     """
 
+    # Streaming calls repeat the same (model, input, output) token counts
+    COST_CACHE_MAX_ENTRIES = 1024
+
     def __init__(self, redis_client: Optional[Any] = None):
         self.redis_client = redis_client
         self.config = get_cost_config()
@@ -123,45 +328,87 @@ class SessionCostTracker:
         # In-memory storage (fallback or single instance)
         self.session_costs: Dict[str, float] = {}
         self.session_tokens: Dict[str, Dict[str, int]] = defaultdict(lambda: {"input": 0, "output": 0})
+        # Wall-clock start of each session, informational only; limits and
+        # metrics never read it
         self.session_start_times: Dict[str, datetime] = {}
+        # Durations come from the monotonic clock: cheaper than datetime
+        # arithmetic on every budget check, and immune to wall-clock jumps
+        self._session_start_monotonic: Dict[str, float] = {}
 
         # Circuit breaker state
         self.circuit_breaker_active = False
         self.circuit_breaker_reset_time: Optional[datetime] = None
+        # Monotonic deadline behind circuit_breaker_reset_time, so the
+        # per-request reset check is a float compare
+        self._circuit_breaker_deadline: Optional[float] = None
         self.total_cost_last_hour = 0.0
 
+        # (input, output) USD per 1M tokens, indexed by Model
+        config = self.config
+        self._prices_per_1m = (
+            (config.gpt5_input_cost_per_1m, config.gpt5_output_cost_per_1m),
+            (config.gpt5_mini_input_cost_per_1m, config.gpt5_mini_output_cost_per_1m),
+            (config.gpt_realtime_input_cost_per_1m, config.gpt_realtime_output_cost_per_1m),
+        )
+        self._price_array = (
+            np.array(self._prices_per_1m, dtype=np.float64) if NUMPY_AVAILABLE else None
+        )
+        # Per instance, since prices come from this tracker's config
+        self._cached_cost = lru_cache(maxsize=self.COST_CACHE_MAX_ENTRIES)(self._compute_cost)
+
         logger.info("SessionCostTracker initialized")
 
     async def start_session(self, session_id: str):
         """Initialize cost tracking for a new session"""
-        self.session_start_times[session_id] = datetime.utcnow()
-        self.session_costs[session_id] = 0.0
-        active_sessions.inc()
+        await self.start_sessions_bulk([session_id])
+
+    async def start_sessions_bulk(self, session_ids: Iterable[str]):
+        """
+        Initialize cost tracking for several sessions at once
+
+        In-memory state is set up first; the Redis writes for every
+        session then go out in a single pipelined round trip.
 
-        if self.redis_client:
+        Args:
+            session_ids: IDs of the sessions to start
+        """
+        session_ids = list(session_ids)
+        start_time = datetime.utcnow()
+        start_monotonic = time.monotonic()
+
+        for session_id in session_ids:
+            self.session_start_times[session_id] = start_time
+            self._session_start_monotonic[session_id] = start_monotonic
+            self.session_costs[session_id] = 0.0
+        active_sessions.inc(len(session_ids))
+
+        if self.redis_client and session_ids:
+            expiry_seconds = self.config.max_session_duration_minutes * 60 + 300  # Add 5 min buffer
+            # Epoch milliseconds: a compact integer field, no ISO-8601 parsing
+            mapping = {
+                "start_ms": int(time.time() * 1000),
+                "cost": "0.0",
+                "input_tokens": "0",
+                "output_tokens": "0"
+            }
             try:
-                await self.redis_client.hset(
-                    f"session:{session_id}",
-                    mapping={
-                        "start_time": self.session_start_times[session_id].isoformat(),
-                        "cost": "0.0",
-                        "input_tokens": "0",
-                        "output_tokens": "0"
-                    }
-                )
-                await self.redis_client.expire(
-                    f"session:{session_id}",
-                    self.config.max_session_duration_minutes * 60 + 300  # Add 5 min buffer
-                )
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for session_id in session_ids:
+                        key = f"session:{session_id}"
+                        pipe.hset(key, mapping=mapping)
+                        pipe.expire(key, expiry_seconds)
+                    await pipe.execute()
             except Exception as e:
                 logger.error(f"Failed to store session in Redis: {e}")
 
-        logger.info(f"Session started: {session_id}")
+        for session_id in session_ids:
+            logger.info(f"Session started: {session_id}")
 
     async def end_session(self, session_id: str):
         """End session and record metrics"""
-        if session_id in self.session_start_times:
-            duration = (datetime.utcnow() - self.session_start_times[session_id]).total_seconds()
+        start = self._session_start_monotonic.pop(session_id, None)
+        if start is not None:
+            duration = time.monotonic() - start
             session_duration.labels(status="completed").observe(duration)
 
             # Cleanup
@@ -178,60 +425,124 @@ class SessionCostTracker:
 
             logger.info(f"Session ended: {session_id}, duration: {duration}s")
 
-    def calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+    def calculate_cost(
+        self,
+        model: Union[str, Model],
+        input_tokens: int,
+        output_tokens: int
+    ) -> float:
         """
         Calculate cost for API call based on token usage
 
+        Results are cached per (model, input_tokens, output_tokens).
+
         Args:
-            model: Model name (gpt-5, gpt-5-mini, gpt-realtime)
+            model: Model name (gpt-5, gpt-5-mini, gpt-realtime) or Model
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
 
         Returns:
             Cost in USD
         """
-        config = self.config
+        return self._cached_cost(model, input_tokens, output_tokens)
 
+    def clear_cost_cache(self) -> None:
+        """
+        Drop cached costs
+
+        Call after changing _prices_per_1m on a live instance.
+        """
+        self._cached_cost.cache_clear()
+
+    def _compute_cost(
+        self,
+        model: Union[str, Model],
+        input_tokens: int,
+        output_tokens: int
+    ) -> float:
+        """Uncached calculate_cost"""
         # Determine pricing based on model
-        if model == "gpt-5":
-            input_cost_per_1m = config.gpt5_input_cost_per_1m
-            output_cost_per_1m = config.gpt5_output_cost_per_1m
-        elif model == "gpt-5-mini":
-            input_cost_per_1m = config.gpt5_mini_input_cost_per_1m
-            output_cost_per_1m = config.gpt5_mini_output_cost_per_1m
-        elif model == "gpt-realtime":
-            input_cost_per_1m = config.gpt_realtime_input_cost_per_1m
-            output_cost_per_1m = config.gpt_realtime_output_cost_per_1m
-        else:
-            logger.warning(f"Unknown model {model}, using gpt-5-mini pricing")
-            input_cost_per_1m = config.gpt5_mini_input_cost_per_1m
-            output_cost_per_1m = config.gpt5_mini_output_cost_per_1m
+        row = _price_row(model)
+        if row is None:
+            logger.warning(f"Unknown model {model}, using {FALLBACK_MODEL} pricing")
+            row = MODEL_PRICE_INDEX[FALLBACK_MODEL]
+        input_cost_per_1m, output_cost_per_1m = self._prices_per_1m[row]
 
         # Calculate cost
         input_cost = (input_tokens / 1_000_000) * input_cost_per_1m
         output_cost = (output_tokens / 1_000_000) * output_cost_per_1m
         total_cost = input_cost + output_cost
 
-        logger.debug(
-            f"Cost calculation: {model} - "
-            f"input_tokens={input_tokens}, output_tokens={output_tokens}, "
-            f"cost=${total_cost:.6f}"
-        )
+        # Only pay for formatting when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Cost calculation: {model} - "
+                f"input_tokens={input_tokens}, output_tokens={output_tokens}, "
+                f"cost=${total_cost:.6f}"
+            )
 
         return total_cost
 
+    def calculate_cost_batch(
+        self,
+        models: Sequence[Union[str, Model]],
+        input_tokens: Sequence[int],
+        output_tokens: Sequence[int]
+    ) -> Sequence[float]:
+        """
+        Calculate costs for many API calls at once
+
+        Same pricing and unknown-model fallback as calculate_cost, applied
+        per call. With numpy installed the arithmetic is one vectorized
+        multiply-add over all calls instead of a Python call per item.
+
+        Args:
+            models: Model name or Model of each call
+            input_tokens: Input tokens of each call
+            output_tokens: Output tokens of each call
+
+        Returns:
+            Cost in USD of each call, in order (a float64 array when numpy
+            is installed, otherwise a list)
+        """
+        fallback = MODEL_PRICE_INDEX[FALLBACK_MODEL]
+        model_rows = {}
+        for model in set(models):
+            row = _price_row(model)
+            if row is None:
+                logger.warning(f"Unknown model {model}, using {FALLBACK_MODEL} pricing")
+                row = fallback
+            model_rows[model] = row
+        rows = [model_rows[model] for model in models]
+
+        if self._price_array is not None:
+            rates = self._price_array[np.asarray(rows, dtype=np.intp)]
+            tokens = np.column_stack((
+                np.asarray(input_tokens, dtype=np.float64),
+                np.asarray(output_tokens, dtype=np.float64),
+            ))
+            costs = (tokens / 1_000_000) * rates
+            return costs[:, 0] + costs[:, 1]
+
+        prices = self._prices_per_1m
+        costs: List[float] = []
+        for row, inp, out in zip(rows, input_tokens, output_tokens):
+            input_cost_per_1m, output_cost_per_1m = prices[row]
+            costs.append((inp / 1_000_000) * input_cost_per_1m + (out / 1_000_000) * output_cost_per_1m)
+        return costs
+
     async def track_usage(
         self,
         session_id: str,
         model: str,
         input_tokens: int,
         output_tokens: int
-    ) -> Dict[str, any]:
+    ) -> UsageResult:
         """
         Track token usage and costs for a session
 
         Returns:
-            Dict with usage stats and budget status
+            UsageResult with usage stats and budget status
         """
         # Calculate cost for this call
         cost = self.calculate_cost(model, input_tokens, output_tokens)
@@ -250,15 +561,16 @@ class SessionCostTracker:
         token_usage.labels(model=model, type="input").inc(input_tokens)
         token_usage.labels(model=model, type="output").inc(output_tokens)
 
-        # Update Redis if available
-        if self.redis_client:
+        # Update Redis if available; zero-token probes change nothing stored
+        if self.redis_client and (input_tokens or output_tokens):
             try:
                 await self.redis_client.hset(
                     f"session:{session_id}",
                     mapping={
                         "cost": str(new_cost),
                         "input_tokens": str(self.session_tokens[session_id]["input"]),
-                        "output_tokens": str(self.session_tokens[session_id]["output"])
+                        "output_tokens": str(self.session_tokens[session_id]["output"]),
+                        "last_update_ms": int(time.time() * 1000)
                     }
                 )
             except Exception as e:
@@ -271,25 +583,115 @@ class SessionCostTracker:
             f"Usage tracked - session:{session_id}, model:{model}, "
             f"tokens:{input_tokens}in/{output_tokens}out, "
             f"cost:${cost:.6f}, total:${new_cost:.6f}, "
-            f"budget_ok:{budget_status['budget_ok']}"
+            f"budget_ok:{budget_status.budget_ok}"
         )
 
-        return {
-            "session_id": session_id,
-            "model": model,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "call_cost": cost,
-            "session_cost": new_cost,
-            **budget_status
-        }
-
-    async def check_budget(self, session_id: str, current_cost: float) -> Dict[str, any]:
+        return UsageResult(
+            session_id,
+            model,
+            input_tokens,
+            output_tokens,
+            cost,
+            new_cost,
+            budget_status.budget_ok,
+            budget_status.remaining_budget_usd,
+            budget_status.remaining_duration_seconds,
+            budget_status.circuit_breaker_active,
+            budget_status.warnings_mask,
+        )
+
+    async def track_usage_bulk(
+        self,
+        updates: Iterable[Tuple[str, str, int, int]]
+    ) -> List[UsageResult]:
+        """
+        Track token usage for several API calls at once
+
+        Costs come from one calculate_cost_batch call and every touched
+        session's final totals go to Redis in a single pipelined round
+        trip. Budget status is checked per call against the session's
+        running cost, as sequential track_usage calls would.
+
+        Args:
+            updates: (session_id, model, input_tokens, output_tokens) per call
+
+        Returns:
+            UsageResult per call, in order
+        """
+        updates = list(updates)
+        if not updates:
+            return []
+
+        session_ids, models, inputs, outputs = zip(*updates)
+        costs = self.calculate_cost_batch(models, inputs, outputs)
+
+        results: List[UsageResult] = []
+        changed_sessions: Dict[str, None] = {}
+        for session_id, model, input_tokens, output_tokens, cost in zip(
+            session_ids, models, inputs, outputs, costs
+        ):
+            cost = float(cost)
+            new_cost = self.session_costs.get(session_id, 0.0) + cost
+            self.session_costs[session_id] = new_cost
+
+            tokens = self.session_tokens[session_id]
+            tokens["input"] += input_tokens
+            tokens["output"] += output_tokens
+
+            api_cost_total.labels(model=model, session_id=session_id).inc(cost)
+            token_usage.labels(model=model, type="input").inc(input_tokens)
+            token_usage.labels(model=model, type="output").inc(output_tokens)
+
+            if input_tokens or output_tokens:
+                changed_sessions[session_id] = None
+
+            budget_status = await self.check_budget(session_id, new_cost)
+            results.append(UsageResult(
+                session_id,
+                model,
+                input_tokens,
+                output_tokens,
+                cost,
+                new_cost,
+                budget_status.budget_ok,
+                budget_status.remaining_budget_usd,
+                budget_status.remaining_duration_seconds,
+                budget_status.circuit_breaker_active,
+                budget_status.warnings_mask,
+            ))
+
+        if self.redis_client and changed_sessions:
+            update_ms = int(time.time() * 1000)
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for session_id in changed_sessions:
+                        tokens = self.session_tokens[session_id]
+                        pipe.hset(
+                            f"session:{session_id}",
+                            mapping={
+                                "cost": str(self.session_costs[session_id]),
+                                "input_tokens": str(tokens["input"]),
+                                "output_tokens": str(tokens["output"]),
+                                "last_update_ms": update_ms
+                            }
+                        )
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f"Failed to update sessions in Redis: {e}")
+
+        logger.info(
+            f"Usage tracked in bulk - calls:{len(updates)}, "
+            f"sessions:{len(set(session_ids))}, cost:${sum(r.call_cost for r in results):.6f}"
+        )
+
+        return results
+
+    async def check_budget(self, session_id: str, current_cost: float) -> BudgetStatus:
         """
         Check if session is within budget limits
 
         Returns:
-            Dict with budget status and remaining budget
+            BudgetStatus with budget status and remaining budget
         """
         config = self.config
 
@@ -298,8 +700,9 @@ class SessionCostTracker:
         remaining_budget = config.max_session_cost_usd - current_cost
 
         # Check session duration
-        if session_id in self.session_start_times:
-            duration = (datetime.utcnow() - self.session_start_times[session_id]).total_seconds()
+        start = self._session_start_monotonic.get(session_id)
+        if start is not None:
+            duration = time.monotonic() - start
             max_duration_seconds = config.max_session_duration_minutes * 60
             duration_ok = duration < max_duration_seconds
             remaining_duration = max_duration_seconds - duration
@@ -316,33 +719,33 @@ class SessionCostTracker:
         if not overall_ok:
             budget_exceeded.labels(session_id=session_id).inc()
 
-        return {
-            "budget_ok": overall_ok,
-            "remaining_budget_usd": max(0, remaining_budget),
-            "remaining_duration_seconds": max(0, remaining_duration),
-            "circuit_breaker_active": self.circuit_breaker_active,
-            "warnings": self._get_warnings(budget_ok, duration_ok, circuit_breaker_ok)
-        }
+        return BudgetStatus(
+            overall_ok,
+            max(0, remaining_budget),
+            max(0, remaining_duration),
+            self.circuit_breaker_active,
+            self._get_warnings_mask(budget_ok, duration_ok, circuit_breaker_ok),
+        )
 
-    def _get_warnings(self, budget_ok: bool, duration_ok: bool, circuit_breaker_ok: bool) -> list:
-        """Generate warning messages for budget status"""
-        warnings = []
+    def _get_warnings_mask(self, budget_ok: bool, duration_ok: bool, circuit_breaker_ok: bool) -> int:
+        """Combine failed budget checks into a WarningFlags bitmask"""
+        mask = 0
 
         if not budget_ok:
-            warnings.append("Session budget limit exceeded")
+            mask |= WarningFlags.BUDGET_EXCEEDED
         if not duration_ok:
-            warnings.append("Session duration limit exceeded")
+            mask |= WarningFlags.DURATION_EXCEEDED
         if not circuit_breaker_ok:
-            warnings.append("System-wide circuit breaker is active")
+            mask |= WarningFlags.CIRCUIT_BREAKER_ACTIVE
 
-        return warnings
+        return int(mask)
 
     async def activate_circuit_breaker(self):
         """Activate circuit breaker to stop all sessions"""
+        cooldown_seconds = self.config.circuit_breaker_reset_minutes * 60
         self.circuit_breaker_active = True
-        self.circuit_breaker_reset_time = datetime.utcnow() + timedelta(
-            minutes=self.config.circuit_breaker_reset_minutes
-        )
+        self.circuit_breaker_reset_time = datetime.utcnow() + timedelta(seconds=cooldown_seconds)
+        self._circuit_breaker_deadline = time.monotonic() + cooldown_seconds
 
         logger.critical(
             f"Circuit breaker activated! Will reset at {self.circuit_breaker_reset_time}"
@@ -350,10 +753,11 @@ class SessionCostTracker:
 
     async def check_circuit_breaker(self):
         """Check if circuit breaker should be reset"""
-        if self.circuit_breaker_active and self.circuit_breaker_reset_time:
-            if datetime.utcnow() >= self.circuit_breaker_reset_time:
+        if self.circuit_breaker_active and self._circuit_breaker_deadline is not None:
+            if time.monotonic() >= self._circuit_breaker_deadline:
                 self.circuit_breaker_active = False
                 self.circuit_breaker_reset_time = None
+                self._circuit_breaker_deadline = None
                 logger.info("Circuit breaker reset")
 
 
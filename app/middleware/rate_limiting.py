@@ -9,10 +9,11 @@ from fastapi import Request, HTTPException
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Optional, Callable, Tuple
 import os
 import logging
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from prometheus_client import Counter, Histogram
 
 logger = logging.getLogger(__name__)
@@ -69,27 +70,59 @@ class RateLimitConfig(BaseModel):
         description="Rate limit for web search calls"
     )
 
-    class Config:
-        env_prefix = "RATE_LIMIT_"
+    # Frozen: get_rate_limit_config() hands the same cached instance to
+    # every caller. RATE_LIMIT_* variables are read there, not by the model.
+    model_config = ConfigDict(frozen=True)
+
+
+# (environment variable, default) for each RateLimitConfig field, in
+# _build_rate_limit_config argument order
+_RATE_LIMIT_ENV = (
+    ("RATE_LIMIT_ENABLED", "true"),
+    ("RATE_LIMIT_DEFAULT", "100/minute"),
+    ("RATE_LIMIT_STATUS", "60/minute"),
+    ("RATE_LIMIT_MAIN_PAGE", "30/minute"),
+    ("RATE_LIMIT_WEBSOCKET", "5/minute"),
+    ("RATE_LIMIT_WEATHER_API", "10/hour"),
+    ("RATE_LIMIT_WEB_SEARCH", "5/hour"),
+)
+
+
+@lru_cache(maxsize=1)
+def _build_rate_limit_config(env: Tuple[str, ...]) -> RateLimitConfig:
+    """Parse and validate one snapshot of the RATE_LIMIT_* variables"""
+    enabled, default, status, main_page, websocket, weather, web_search = env
+    return RateLimitConfig(
+        enabled=enabled.lower() == "true",
+        default_limit=default,
+        status_limit=status,
+        main_page_limit=main_page,
+        websocket_limit=websocket,
+        weather_api_limit=weather,
+        web_search_limit=web_search
+    )
 
 
 def get_rate_limit_config() -> RateLimitConfig:
     """
     Load rate limit configuration from environment
 
+    The parsed config is cached against a snapshot of the RATE_LIMIT_*
+    variables, so repeat calls skip validation and a changed environment
+    is picked up on the next call. The config is frozen, so the shared
+    instance cannot be modified by a caller.
+
     NOTE: In-memory storage only. All limits reset on server restart.
     """
-    return RateLimitConfig(
-        enabled=os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true",
-        default_limit=os.getenv("RATE_LIMIT_DEFAULT", "100/minute"),
-        status_limit=os.getenv("RATE_LIMIT_STATUS", "60/minute"),
-        main_page_limit=os.getenv("RATE_LIMIT_MAIN_PAGE", "30/minute"),
-        websocket_limit=os.getenv("RATE_LIMIT_WEBSOCKET", "5/minute"),
-        weather_api_limit=os.getenv("RATE_LIMIT_WEATHER_API", "10/hour"),
-        web_search_limit=os.getenv("RATE_LIMIT_WEB_SEARCH", "5/hour")
+    return _build_rate_limit_config(
+        tuple(os.getenv(name, default) for name, default in _RATE_LIMIT_ENV)
     )
 
 
+get_rate_limit_config.cache_info = _build_rate_limit_config.cache_info
+get_rate_limit_config.cache_clear = _build_rate_limit_config.cache_clear
+
+
 # Redis support removed - using in-memory storage only
 # This simplifies deployment for single instance use case
 # Rate limit counters reset on server restart
@@ -151,14 +184,14 @@ def get_rate_limit_for_user_tier(request: Request, endpoint: str) -> str:
 
     # Import tier configuration
     try:
-        from app.models.user import TIER_CONFIGURATIONS, UserTier
+        from app.models.user import TIER_CONFIGURATIONS
 
-        tier_enum = UserTier(tier)
-        tier_limits = TIER_CONFIGURATIONS[tier_enum]
+        # Keyed by str-enum members, so the tier string looks up directly
+        tier_limits = TIER_CONFIGURATIONS[tier]
 
         # Return tier-specific rate limit
         return tier_limits.rate_limit
-    except (ImportError, ValueError, KeyError) as e:
+    except (ImportError, ValueError, KeyError, TypeError) as e:
         logger.warning(f"Error getting tier limits: {e}, using default")
         # Fallback to configured endpoint limit
         return get_rate_limit_for_endpoint(endpoint)
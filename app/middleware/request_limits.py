@@ -8,8 +8,8 @@ Prevents:
 - Large response payloads (data exfiltration)
 - Streaming response overflow
 """
-import json
 import logging
+import re
 from typing import Optional
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
@@ -17,6 +17,62 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# HTTP methods whose request body is inspected for JSON nesting depth
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Escape sequences, removed first so that every remaining quote delimits a
+# string. Matching strings with their escapes in one pattern backtracks
+# quadratically on an unterminated string of escaped quotes.
+_JSON_ESCAPE_RE = re.compile(rb"\\.", re.DOTALL)
+
+# JSON string literals once escapes are gone; brackets inside strings do
+# not count towards nesting. Only a final unterminated quote scans to the
+# end, so both passes stay linear.
+_JSON_STRING_RE = re.compile(rb'"[^"]*"')
+
+# Empty containers, replaced by a scalar: a level only counts when its
+# container holds a value, so [[]] and {"a": {}} have depth 1
+_EMPTY_CONTAINER_RE = re.compile(rb"[\[{][ \t\n\r]*[\]}]")
+
+# Every byte except the four structural brackets, for bytes.translate
+_NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b"[]{}")
+
+_OPENING_BRACKETS = frozenset(b"[{")
+
+
+def scan_json_depth(body: bytes, max_depth: int) -> int:
+    """
+    Measure bracket nesting depth of a raw JSON body without parsing it
+
+    Escapes are dropped, string literals and empty containers are
+    replaced by a scalar and every non-bracket byte is deleted by the
+    C-level regex and bytes.translate, so the Python loop only visits
+    brackets. Scanning stops as soon as max_depth is exceeded.
+
+    Args:
+        body: Raw request body
+        max_depth: Depth at which scanning may stop early
+
+    Returns:
+        Maximum nesting depth seen (max_depth + 1 if exceeded)
+    """
+    scalars = _JSON_STRING_RE.sub(b"0", _JSON_ESCAPE_RE.sub(b"", body))
+    brackets = _EMPTY_CONTAINER_RE.sub(b"0", scalars).translate(None, _NON_BRACKET_BYTES)
+
+    depth = 0
+    deepest = 0
+    for byte in brackets:
+        if byte in _OPENING_BRACKETS:
+            depth += 1
+            if depth > deepest:
+                deepest = depth
+                if deepest > max_depth:
+                    break
+        else:
+            depth -= 1
+
+    return deepest
+
 
 class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -45,8 +101,11 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
         """
         Middleware dispatch handler
         """
+        method = request.method
+        headers = request.headers
+
         # Check Content-Length header
-        content_length = request.headers.get("content-length")
+        content_length = headers.get("content-length")
 
         if content_length:
             try:
@@ -72,8 +131,17 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
                     content={"error": "Invalid Content-Length header"}
                 )
 
+        # Only body-carrying methods can smuggle a JSON bomb; skip the
+        # body read entirely for everything else
+        if method not in BODY_METHODS:
+            return await call_next(request)
+
+        # No declared body and no chunked transfer means nothing to scan
+        if (not content_length or content_length == "0") and "transfer-encoding" not in headers:
+            return await call_next(request)
+
         # Check JSON depth for JSON requests
-        content_type = request.headers.get("content-type", "")
+        content_type = headers.get("content-type", "")
         if "application/json" in content_type:
             json_depth_check = await self.validate_json_depth(request)
             if json_depth_check:
@@ -130,11 +198,31 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
             if not body:
                 return None
 
-            # Parse JSON
-            data = json.loads(body)
+            # Chunked or mislabelled bodies can slip past the Content-Length
+            # check; never scan past the size limit
+            if len(body) > self.max_size_bytes:
+                return JSONResponse(
+                    status_code=413,
+                    content={
+                        "error": "Payload Too Large",
+                        "max_size_mb": self.max_size_bytes / (1024 * 1024)
+                    }
+                )
+
+            # Only objects and arrays can nest; anything else is either a
+            # scalar or not JSON at all, which the application rejects
+            stripped = body.lstrip()
+            if not stripped or stripped[:1] not in (b"{", b"["):
+                return None
+
+            # Every nesting level needs an opening bracket, so the bracket
+            # count is an upper bound on depth; bytes.count runs in C and
+            # lets shallow payloads skip the full scan
+            if body.count(b"{") + body.count(b"[") <= self.max_json_depth:
+                return None
 
             # Check nesting depth
-            depth = self._get_json_depth(data)
+            depth = scan_json_depth(body, self.max_json_depth)
 
             if depth > self.max_json_depth:
                 logger.warning(
@@ -150,46 +238,11 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
                     }
                 )
 
-        except json.JSONDecodeError:
-            # Invalid JSON - let the application handle it
-            pass
         except Exception as e:
             logger.error(f"Error validating JSON depth: {e}")
 
         return None
 
-    def _get_json_depth(self, obj, current_depth: int = 0) -> int:
-        """
-        Recursively calculate JSON nesting depth
-
-        Args:
-            obj: JSON object
-            current_depth: Current recursion depth
-
-        Returns:
-            Maximum depth
-        """
-        if not isinstance(obj, (dict, list)):
-            return current_depth
-
-        if isinstance(obj, dict):
-            if not obj:
-                return current_depth
-            return max(
-                self._get_json_depth(value, current_depth + 1)
-                for value in obj.values()
-            )
-
-        if isinstance(obj, list):
-            if not obj:
-                return current_depth
-            return max(
-                self._get_json_depth(item, current_depth + 1)
-                for item in obj
-            )
-
-        return current_depth
-
 
 class ResponseSizeLimitMiddleware(BaseHTTPMiddleware):
     """
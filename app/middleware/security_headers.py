@@ -53,6 +53,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         self.csp_report_uri = csp_report_uri
         self.custom_csp = custom_csp
 
+        # Header values never change per request, so encode them once as
+        # raw ASGI (name, value) pairs that dispatch can splice in directly
+        self._static_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in (
+                ("X-Content-Type-Options", "nosniff"),
+                ("X-Frame-Options", "DENY"),
+                ("X-XSS-Protection", "1; mode=block"),
+                ("Content-Security-Policy", self._build_csp_header()),
+                ("Permissions-Policy", self._build_permissions_policy()),
+                ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            )
+        ]
+        self._hsts_header = (
+            b"strict-transport-security",
+            self._build_hsts_header().encode("latin-1"),
+        )
+        # Names dropped from the downstream response before the static set
+        # is appended: anything we overwrite plus information-leaking headers
+        self._stripped_headers = frozenset(
+            [name for name, _ in self._static_headers] + [b"server", b"x-powered-by"]
+        )
+        self._stripped_headers_hsts = self._stripped_headers | {self._hsts_header[0]}
+
     def _build_hsts_header(self) -> str:
         """Build HSTS header value."""
         hsts = f"max-age={self.hsts_max_age}"
@@ -133,35 +157,18 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         """
         response = await call_next(request)
 
-        # HSTS - Force HTTPS connections
-        if self.enable_hsts and request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = self._build_hsts_header()
-
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # XSS Protection (legacy, but still useful for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Content Security Policy
-        response.headers["Content-Security-Policy"] = self._build_csp_header()
-
-        # Permissions Policy (Feature Policy)
-        response.headers["Permissions-Policy"] = self._build_permissions_policy()
-
-        # Referrer Policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Remove Server header to avoid information disclosure
-        if "Server" in response.headers:
-            del response.headers["Server"]
-
-        # Remove X-Powered-By if present
-        if "X-Powered-By" in response.headers:
-            del response.headers["X-Powered-By"]
+        # Rebuild the raw header list in one pass instead of a find-or-append
+        # scan per header: drop Server/X-Powered-By and any values we own,
+        # then append the precomputed security headers
+        add_hsts = self.enable_hsts and request.url.scheme == "https"
+        stripped = self._stripped_headers_hsts if add_hsts else self._stripped_headers
+
+        raw = response.headers.raw
+        raw[:] = [item for item in raw if item[0] not in stripped]
+        raw.extend(self._static_headers)
+        if add_hsts:
+            # HSTS - Force HTTPS connections
+            raw.append(self._hsts_header)
 
         return response
 
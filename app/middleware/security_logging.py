@@ -16,11 +16,78 @@ Redacts:
 """
 import re
 import logging
-from typing import Dict, Any, Optional
-from fastapi import Request
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from app.security.regex_compat import (
+    RE2_AVAILABLE,
+    compile_linear,
+    re2,
+    scope_inline_flags,
+    to_re2_pattern,
+)
 
 logger = logging.getLogger(__name__)
 
+# Standard headers that never carry credentials; their values are logged
+# as-is without running the redaction patterns
+_SAFE_HEADERS = frozenset({
+    "host",
+    "user-agent",
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "content-type",
+    "content-length",
+    "connection",
+    "cache-control",
+    "origin",
+    "referer",
+    "upgrade",
+    "sec-fetch-mode",
+    "sec-fetch-site",
+    "sec-fetch-dest",
+})
+
+
+def _build_redaction_matcher(
+    patterns: List[Tuple[str, str]]
+) -> Tuple[Callable[[str], List[int]], List[Tuple[Any, str]]]:
+    """
+    Compile redaction patterns for a single-pass pre-scan
+
+    With RE2 installed all patterns go into one RE2::Set, which reports
+    every matching pattern index in a single linear scan. Otherwise a
+    combined Python alternation tells us whether anything matches at all,
+    so clean input skips the per-pattern substitutions. Either way the
+    patterns go through regex_compat, so \\s, \\w and \\d match the same
+    text under RE2 as under re.
+
+    Args:
+        patterns: (regex, replacement) pairs
+
+    Returns:
+        Tuple of (matcher returning indices of patterns to apply,
+        list of (compiled pattern, replacement))
+    """
+    compiled = [(compile_linear(pattern), repl) for pattern, repl in patterns]
+
+    if RE2_AVAILABLE:
+        try:
+            pattern_set = re2.Set.SearchSet()
+            for pattern, _ in patterns:
+                pattern_set.Add(to_re2_pattern(pattern))
+            pattern_set.Compile()
+        except (ValueError, re2.error):
+            # A pattern RE2 cannot take; fall back to the alternation
+            pass
+        else:
+            return (lambda data: sorted(pattern_set.Match(data) or ())), compiled
+
+    union = re.compile('|'.join(scope_inline_flags(pattern) for pattern, _ in patterns))
+    all_indices = list(range(len(patterns)))
+
+    return (lambda data: all_indices if union.search(data) else []), compiled
+
 
 class SecurityLogger:
     """
@@ -29,7 +96,7 @@ class SecurityLogger:
 
     # Patterns for sensitive data to redact
     SENSITIVE_PATTERNS = [
-        (r'(?i)(password|passwd|pwd)[\s:=]+[\w\S]+', '[REDACTED PASSWORD]'),
+        (r'(?i)(password|passwd|pwd)[\s:=]+\S+', '[REDACTED PASSWORD]'),
         (r'(?i)(api[_-]?key|apikey)[\s:=]+[\w-]+', '[REDACTED API_KEY]'),
         (r'(?i)(token|bearer)[\s:=]+[\w.-]+', '[REDACTED TOKEN]'),
         (r'(?i)(secret|secret[_-]?key)[\s:=]+[\w-]+', '[REDACTED SECRET]'),
@@ -46,6 +113,10 @@ class SecurityLogger:
         'set-cookie',
     ]
 
+    # Compiled once per class; the matcher is a plain function, not a method
+    _REDACTION_MATCHER, _REDACTION_PATTERNS = _build_redaction_matcher(SENSITIVE_PATTERNS)
+    _REDACTION_MATCHER = staticmethod(_REDACTION_MATCHER)
+
     def _redact_sensitive_data(self, data: str) -> str:
         """
         Redact sensitive data from string
@@ -58,8 +129,9 @@ class SecurityLogger:
         """
         redacted = data
 
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            redacted = re.sub(pattern, replacement, redacted)
+        for index in self._REDACTION_MATCHER(data):
+            pattern, replacement = self._REDACTION_PATTERNS[index]
+            redacted = pattern.sub(replacement, redacted)
 
         return redacted
 
@@ -76,8 +148,11 @@ class SecurityLogger:
         redacted = {}
 
         for key, value in headers.items():
-            if key.lower() in self.SENSITIVE_HEADERS:
+            key_lower = key.lower()
+            if key_lower in self.SENSITIVE_HEADERS:
                 redacted[key] = '[REDACTED]'
+            elif key_lower in _SAFE_HEADERS:
+                redacted[key] = value
             else:
                 redacted[key] = self._redact_sensitive_data(str(value))
 
@@ -170,16 +245,24 @@ class SecurityLoggingMiddleware:
         self.app = app
         self.logger = SecurityLogger()
 
-    async def __call__(self, request: Request, call_next):
+    async def __call__(self, scope, receive, send):
         """
-        Middleware handler
+        ASGI handler
         """
-        # Log request (excluding sensitive data)
-        await self.logger.log_request(
-            path=request.url.path,
-            headers=dict(request.headers)
-        )
-
-        response = await call_next(request)
-
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Log request (excluding sensitive data); skip header decoding and
+        # redaction entirely when INFO records would be discarded anyway
+        if logger.isEnabledFor(logging.INFO):
+            headers = {
+                key.decode("latin-1"): value.decode("latin-1")
+                for key, value in scope.get("headers", [])
+            }
+            await self.logger.log_request(
+                path=scope.get("path", ""),
+                headers=headers
+            )
+
+        await self.app(scope, receive, send)
@@ -118,17 +118,14 @@ class WebSocketOriginValidator:
         Returns:
             True if origin is valid, False otherwise
         """
-        # Extract origin from headers
-        origin = websocket.headers.get("origin") or websocket.headers.get("Origin")
+        # Extract origin from headers (Starlette headers are case-insensitive)
+        origin = websocket.headers.get("origin")
 
         # Check if origin header is required
         if self.require_origin and not origin:
             self.logger.warning(
                 "WebSocket connection rejected: Missing Origin header",
-                extra={
-                    "client": websocket.client,
-                    "headers": dict(websocket.headers)
-                }
+                extra={"client": websocket.client}
             )
             return False
 
@@ -9,13 +9,62 @@ Prevents:
 - DTD retrieval attacks
 """
 import logging
-from xml.etree.ElementTree import XMLParser, ParseError
-from typing import Optional
-from fastapi import Request
+from xml.etree.ElementTree import ParseError, fromstring
+from xml.parsers import expat
+from typing import Iterable, Optional, Set, Union
 from fastapi.responses import JSONResponse
 
+from app.security.literal_scanner import LiteralScanner
+
+# defusedxml (declared in requirements.txt) enforces DTD/entity limits
+# inside the parser; without it parse_xml rejects the same constructs by
+# keyword before handing the document to ElementTree
+try:
+    from defusedxml import (
+        DTDForbidden,
+        EntitiesForbidden,
+        ExternalReferenceForbidden,
+    )
+    from defusedxml.ElementTree import fromstring as _safe_fromstring
+    DEFUSEDXML_AVAILABLE = True
+except ImportError:
+    _safe_fromstring = None
+    DEFUSEDXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Limits for XML request bodies validated by XMLProtectionMiddleware
+MAX_XML_BYTES = 1_048_576
+MAX_XML_DEPTH = 40
+
+XML_MEDIA_TYPES = frozenset({"application/xml", "text/xml"})
+
+
+def is_xml_media_type(content_type: str) -> bool:
+    """
+    Check whether a Content-Type header names an XML media type
+
+    Parses the media type instead of substring-matching "xml", so
+    parameters and unrelated types (application/vnd.x.xml-fallback) do
+    not trigger XML handling.
+
+    Args:
+        content_type: Raw Content-Type header value
+
+    Returns:
+        True for application/xml, text/xml and any +xml suffix type
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type in XML_MEDIA_TYPES or media_type.endswith("+xml")
+
+
+# Entity and external-reference keywords, found in one pass over the document
+_XML_LITERALS = LiteralScanner({
+    "dtd": ['<!DOCTYPE'],
+    "entity": ['<!ENTITY'],
+    "external": ['SYSTEM', 'PUBLIC'],
+})
+
 
 class XMLProtection:
     """
@@ -43,12 +92,15 @@ class XMLProtection:
         self.forbid_entities = forbid_entities
         self.forbid_external = forbid_external
 
-    async def parse_xml(self, xml_content: str):
+    async def parse_xml(self, xml_content: Union[str, bytes]):
         """
         Safely parse XML with protection against attacks
 
+        Raw body bytes are parsed as-is, so the declared encoding is
+        honoured by the parser and the body is never decoded to str.
+
         Args:
-            xml_content: XML string to parse
+            xml_content: XML string or raw body bytes to parse
 
         Raises:
             Exception: If XML contains malicious content
@@ -56,102 +108,294 @@ class XMLProtection:
         Returns:
             Parsed XML element tree
         """
+        if DEFUSEDXML_AVAILABLE:
+            return self._parse_defused(xml_content)
+
+        # Expat expands internal entities while parsing, so the keyword
+        # checks run first so ElementTree never sees a forbidden construct
+        literals = _XML_LITERALS.scan(xml_content)
+        self._validate_no_dtd(literals)
+        self._validate_no_entity_expansion(literals)
+        self._validate_no_external_entities(literals)
+
         try:
-            # Create secure XML parser
-            parser = XMLParser()
-
-            # Disable dangerous features
-            if hasattr(parser, 'parser'):
-                xmlparser = parser.parser
-
-                # Disable DTD processing
-                if self.forbid_dtd:
-                    try:
-                        xmlparser.SetParamEntityParsing(0)
-                    except AttributeError:
-                        pass
-
-                # Disable entity expansion
-                if self.forbid_entities:
-                    try:
-                        xmlparser.DefaultHandler = None
-                        xmlparser.EntityDeclHandler = None
-                        xmlparser.UnparsedEntityDeclHandler = None
-                    except AttributeError:
-                        pass
-
-            # Parse XML
-            from xml.etree import ElementTree as ET
-            root = ET.fromstring(xml_content, parser=parser)
-
-            # Additional validation
-            self._validate_no_entity_expansion(xml_content)
-            self._validate_no_external_entities(xml_content)
-
-            return root
+            return fromstring(xml_content)
 
         except ParseError as e:
             logger.error(f"XML parsing error: {e}")
             raise Exception(f"Invalid XML: {e}")
 
-    def _validate_no_entity_expansion(self, xml_content: str) -> None:
+    def _parse_defused(self, xml_content: Union[str, bytes]):
+        """
+        Parse with defusedxml, which rejects DTDs and entity declarations
+        as the parser reaches them instead of grepping the body afterwards
+
+        Args:
+            xml_content: XML string or raw body bytes to parse
+
+        Raises:
+            Exception: If XML contains malicious content
+
+        Returns:
+            Parsed XML element tree
+        """
+        try:
+            return _safe_fromstring(
+                xml_content,
+                forbid_dtd=self.forbid_dtd,
+                forbid_entities=self.forbid_entities,
+                forbid_external=self.forbid_external
+            )
+        except DTDForbidden:
+            logger.warning("DTD detected in XML")
+            raise Exception("XML DTDs are not allowed (entity expansion protection)")
+        except EntitiesForbidden:
+            logger.warning("Entity expansion attempt detected in XML")
+            raise Exception("XML entity expansion is not allowed")
+        except ExternalReferenceForbidden:
+            logger.warning("External entity reference detected in XML")
+            raise Exception("External entity references are not allowed")
+        except ParseError as e:
+            logger.error(f"XML parsing error: {e}")
+            raise Exception(f"Invalid XML: {e}")
+
+    def _validate_no_dtd(self, literals: Set[str]) -> None:
+        """
+        Check for a document type declaration
+
+        Args:
+            literals: Keyword categories found by _XML_LITERALS
+
+        Raises:
+            Exception: If a DTD is present
+        """
+        if self.forbid_dtd:
+            if "dtd" in literals:
+                logger.warning("DTD detected in XML")
+                raise Exception("XML DTDs are not allowed (entity expansion protection)")
+
+    def _validate_no_entity_expansion(self, literals: Set[str]) -> None:
         """
         Check for entity expansion patterns
 
+        Args:
+            literals: Keyword categories found by _XML_LITERALS
+
         Raises:
             Exception: If entity expansion detected
         """
         if self.forbid_entities:
-            if '<!ENTITY' in xml_content:
+            if "entity" in literals:
                 logger.warning("Entity expansion attempt detected in XML")
                 raise Exception("XML entity expansion is not allowed")
 
-    def _validate_no_external_entities(self, xml_content: str) -> None:
+    def _validate_no_external_entities(self, literals: Set[str]) -> None:
         """
         Check for external entity references
 
+        Args:
+            literals: Keyword categories found by _XML_LITERALS
+
         Raises:
             Exception: If external entities detected
         """
         if self.forbid_external:
-            if 'SYSTEM' in xml_content or 'PUBLIC' in xml_content:
+            if "external" in literals:
                 logger.warning("External entity reference detected in XML")
                 raise Exception("External entity references are not allowed")
 
 
+class XMLStreamValidator:
+    """
+    Incremental XML validator fed one body chunk at a time
+
+    Drives expat directly (no element tree is built) and rejects DTDs,
+    entity declarations, external references and excessive nesting from
+    the parser callbacks, before the rest of the document is read.
+    """
+
+    def __init__(self, protection: XMLProtection, max_depth: int = MAX_XML_DEPTH):
+        """
+        Initialize validator
+
+        Args:
+            protection: XMLProtection whose forbid_* flags are enforced
+            max_depth: Maximum element nesting depth
+        """
+        self.max_depth = max_depth
+        self.depth = 0
+
+        parser = expat.ParserCreate()
+        parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_NEVER)
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        if protection.forbid_dtd:
+            parser.StartDoctypeDeclHandler = self._forbid_dtd
+        if protection.forbid_entities:
+            parser.EntityDeclHandler = self._forbid_entity
+            parser.UnparsedEntityDeclHandler = self._forbid_entity
+        if protection.forbid_external:
+            parser.ExternalEntityRefHandler = self._forbid_external
+        self._parser = parser
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Parse the next chunk of the document
+
+        Raises:
+            Exception: If the XML is malformed or malicious
+        """
+        self._parse(chunk, False)
+
+    def close(self) -> None:
+        """
+        Finish parsing once the whole document has been fed
+
+        Raises:
+            Exception: If the XML is incomplete, malformed or malicious
+        """
+        self._parse(b"", True)
+
+    def _parse(self, data: bytes, final: bool) -> None:
+        try:
+            self._parser.Parse(data, final)
+        except expat.ExpatError as e:
+            raise Exception(f"Invalid XML: {e}")
+
+    def _start(self, name, attrs):
+        self.depth += 1
+        if self.depth > self.max_depth:
+            raise Exception(f"XML nesting exceeds maximum depth of {self.max_depth}")
+
+    def _end(self, name):
+        self.depth -= 1
+
+    def _forbid_dtd(self, *args):
+        logger.warning("DTD detected in XML")
+        raise Exception("XML DTDs are not allowed (entity expansion protection)")
+
+    def _forbid_entity(self, *args):
+        logger.warning("Entity expansion attempt detected in XML")
+        raise Exception("XML entity expansion is not allowed")
+
+    def _forbid_external(self, *args):
+        logger.warning("External entity reference detected in XML")
+        raise Exception("External entity references are not allowed")
+
+
 class XMLProtectionMiddleware:
     """
     Middleware for XML request validation
+
+    XML bodies are streamed through XMLStreamValidator as they arrive,
+    so an oversized or malicious document is rejected without first
+    buffering it whole. Accepted bodies are replayed to the application.
     """
 
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        max_bytes: int = MAX_XML_BYTES,
+        max_depth: int = MAX_XML_DEPTH,
+        xml_paths: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize middleware
+
+        Args:
+            app: ASGI application
+            max_bytes: Maximum XML body size (larger bodies get 413)
+            max_depth: Maximum element nesting depth
+            xml_paths: Paths whose XML bodies are validated; None
+                validates XML sent to any path
+        """
         self.app = app
         self.protection = XMLProtection()
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.xml_paths = frozenset(xml_paths) if xml_paths is not None else None
 
-    async def __call__(self, request: Request, call_next):
+    async def __call__(self, scope, receive, send):
         """
-        Middleware handler
+        ASGI handler
         """
-        content_type = request.headers.get("content-type", "")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Check if request contains XML
-        if "xml" in content_type.lower():
+        content_type = ""
+        content_length = None
+        for key, value in scope.get("headers", []):
+            if key == b"content-type":
+                content_type = value.decode("latin-1")
+            elif key == b"content-length":
+                content_length = value
+
+        # Only XML bodies bound for endpoints that process XML are parsed
+        if not is_xml_media_type(content_type) or (
+            self.xml_paths is not None and scope.get("path") not in self.xml_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Reject declared oversized bodies before reading any of them
+        if content_length is not None:
             try:
-                body = await request.body()
-                xml_content = body.decode('utf-8')
-
-                # Validate XML
-                await self.protection.parse_xml(xml_content)
-
-            except Exception as e:
-                logger.warning(f"XML validation failed: {e}")
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "error": "Invalid XML",
-                        "message": str(e)
-                    }
-                )
-
-        response = await call_next(request)
-        return response
+                declared = int(content_length)
+            except ValueError:
+                declared = None
+            if declared is not None and declared > self.max_bytes:
+                await self._payload_too_large(scope, receive, send)
+                return
+
+        validator = XMLStreamValidator(self.protection, self.max_depth)
+        messages = []
+        received = 0
+
+        try:
+            while True:
+                message = await receive()
+                messages.append(message)
+                if message["type"] != "http.request":
+                    break
+
+                chunk = message.get("body", b"")
+                received += len(chunk)
+                if received > self.max_bytes:
+                    await self._payload_too_large(scope, receive, send)
+                    return
+
+                validator.feed(chunk)
+                if not message.get("more_body", False):
+                    validator.close()
+                    break
+
+        except Exception as e:
+            logger.warning(f"XML validation failed: {e}")
+            response = JSONResponse(
+                status_code=400,
+                content={
+                    "error": "Invalid XML",
+                    "message": str(e)
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        # Replay the already-consumed body to the application
+        async def replay():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        await self.app(scope, replay, send)
+
+    async def _payload_too_large(self, scope, receive, send):
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "error": "Payload Too Large",
+                "max_size_mb": self.max_bytes / (1024 * 1024)
+            }
+        )
+        await response(scope, receive, send)
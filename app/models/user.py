@@ -2,7 +2,7 @@
 User models and tier definitions for authentication system
 """
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -21,11 +21,13 @@ class TierLimits(BaseModel):
     session_timeout: int = Field(description="Session timeout in seconds")
     websocket_connections: int = Field(description="Max concurrent WebSocket connections")
 
-    class Config:
-        frozen = True  # Immutable
+    model_config = ConfigDict(frozen=True)  # Immutable
 
 
-# Tier configuration (immutable)
+# Tier configuration (immutable). UserTier is a str enum, so members hash
+# and compare equal to their values: lookups by the plain tier string
+# ("free", as stored on User with use_enum_values) hit the same entries
+# without constructing a UserTier first.
 TIER_CONFIGURATIONS = {
     UserTier.FREE: TierLimits(
         rate_limit="5/minute",
@@ -57,6 +59,8 @@ class TokenData(BaseModel):
     jti: Optional[str] = Field(default=None, description="JWT ID for revocation tracking")
     token_type: Optional[str] = Field(default="access", description="Token type (access/refresh)")
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
 
 class User(BaseModel):
     """User model with authentication data"""
@@ -66,8 +70,7 @@ class User(BaseModel):
     last_login: Optional[datetime] = None
 
     def get_limits(self) -> TierLimits:
-        """Get tier limits for this user"""
+        """Get tier limits for this user (tier is stored as its str value)"""
         return TIER_CONFIGURATIONS[self.tier]
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
@@ -19,13 +19,393 @@ All validators implement security controls against:
 - Unicode/Null Byte exploits
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 import re
 import socket
+import string
 import urllib.parse
+from functools import lru_cache, wraps
 from typing import Optional
 from ipaddress import ip_address, IPv4Address, IPv6Address
 
+from app.security.literal_scanner import LiteralScanner
+from app.security.regex_compat import to_re2_pattern
+
+# Optional RE2 import - scans a whole denylist in one linear DFA pass
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+
+# Patterns are compiled once at import time; validators run on every
+# request and should only pay for matching, not for re's cache lookup.
+
+_IP_RE = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+# Location: SQL injection patterns
+_SQL_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r"('|(\\'))",  # Single quotes
+    r'("|(\\"))',  # Double quotes
+    r'(;|--)',     # SQL terminators/comments
+    r'\bor\b[^=\n]{0,200}=[^\n]{0,200}',  # OR clauses (bounded, no .*/.* overlap)
+    r'\bunion\b',    # UNION statements
+    r'\bselect\b',   # SELECT statements
+    r'\bdrop\b',     # DROP statements
+    r'\bdelete\b',   # DELETE statements
+    r'\binsert\b',   # INSERT statements
+    r'\bupdate\b',   # UPDATE statements
+)]
+
+# Location: command injection patterns
+_CMD_RES = [re.compile(p) for p in (
+    r'[;&|`$]',        # Shell metacharacters
+    r'\$\(',           # Command substitution
+    r'`',              # Backticks
+    r'\|\s{0,8}\w+',    # Pipes
+    r'&&|\|\|',        # Logical operators
+)]
+
+# Location: XSS patterns
+_XSS_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'<script',
+    r'javascript:',
+    r'onerror\s*=',
+    r'onload\s*=',
+    r'<iframe',
+    r'<img',
+    r'<svg',
+    r'<object',
+    r'<embed',
+)]
+
+# Location: positive allowlist (Unicode letters, spaces, hyphens, apostrophes, commas)
+_ALLOWLIST_RE = re.compile(r"^[\w\s\-',\.]+$", re.UNICODE)
+
+# Search: SQL injection patterns (more lenient than location for natural queries)
+_DANGEROUS_SQL_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r";\s*(drop|delete|update|insert)\s+",
+    r"'\s*or\s*'1'\s*=\s*'1",
+    r"--\s*$",
+    r";\s*--",
+    r"union\s+select",
+)]
+
+# Search: prompt injection patterns
+_PROMPT_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'ignore\s+previous\s+instructions',
+    r'system\s*:\s*override',
+    r'forget\s+everything',
+    r'\[inst\]',
+    r'\[/inst\]',
+    r'\\n\\nhuman:',
+    r'developer\s+mode',
+    r'bypass\s+all\s+restrictions',
+    r'reveal\s+system\s+prompt',
+)]
+
+# Search: XSS patterns
+_QUERY_XSS_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'<script',
+    r'javascript:',
+    r'onerror\s*=',
+    r'onload\s*=',
+    r'<iframe',
+)]
+
+_SHELL_META_RE = re.compile(r'[;&|`$]')
+
+# Accept-Language: quality factor and RFC 5646 format
+_QUALITY_RE = re.compile(r';\s*q\s*=\s*[0-9.]+')
+_RFC5646_RE = re.compile(r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?(-[a-zA-Z]{2})?(\s*;\s*q\s*=\s*[0-1](\.\d{1,3})?)?(,\s*[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?(-[a-zA-Z]{2})?(\s*;\s*q\s*=\s*[0-1](\.\d{1,3})?)?)*$')
+
+# URL: DNS rebinding protection, internal-looking hostname words
+_SUSPICIOUS_HOST_RES = [re.compile(p) for p in (
+    r'\binternal\b',
+    r'\bintranet\b',
+    r'\bprivate\b',
+    r'\blocal\b',
+    r'\bad\b',  # Active Directory domain
+    r'\bcorp\b',
+    r'\bdev\b',
+    r'\btest\b',
+    r'\bstaging\b',
+)]
+
+# URL: private address embedded after a scheme separator
+_IP_IN_URL_RE = re.compile(r'//(localhost|127\.|10\.|172\.(1[6-9]|2[0-9]|3[01])\.|192\.168\.|169\.254\.|0\.0\.0\.0)')
+
+# URL: common SSRF bypass patterns
+_SSRF_BYPASS_RES = [re.compile(p) for p in (
+    r'@localhost',          # http://user@localhost/
+    r'@127\.0\.0\.1',       # http://user@127.0.0.1/
+    r'@0\.0\.0\.0',         # http://user@0.0.0.0/
+    r'@169\.254\.',         # http://user@169.254.1.1/
+    r'::1',                 # IPv6 loopback
+    r'\[::1\]',             # Bracketed IPv6 loopback
+    r'\[::\]',              # IPv6 unspecified
+    r'\[fc00:',             # ULA prefix
+)]
+
+
+def _build_denylist_set(denylist):
+    """
+    Compile a denylist into a single RE2 pattern set, if RE2 is installed
+
+    Args:
+        denylist: (compiled pattern, error message) pairs
+
+    Returns:
+        Compiled re2.Set, or None when RE2 is unavailable
+    """
+    if not RE2_AVAILABLE:
+        return None
+
+    pattern_set = re2.Set.SearchSet()
+    for rx, _ in denylist:
+        # Widen \s/\w so the set never misses what the Python pattern matches
+        pattern = to_re2_pattern(rx.pattern)
+        pattern_set.Add(f"(?i){pattern}" if rx.flags & re.IGNORECASE else pattern)
+    pattern_set.Compile()
+    return pattern_set
+
+
+# Non-ASCII letters that re.IGNORECASE matches against ASCII ones. RE2's
+# word boundaries are ASCII-only, so "ſelect" would slip past \bselect\b
+# in the pattern set; the set is queried with them folded to ASCII.
+_ASCII_FOLD_TABLE = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+def _check_denylist(v, denylist, pattern_set):
+    """
+    Raise ValueError for the first denylist pattern that matches v
+
+    With RE2, one pass over v reports every candidate pattern and clean
+    input never touches the Python regexes. RE2's ASCII-only word
+    boundaries can over-report, so candidates are confirmed with the
+    original pattern to keep the exact matching semantics.
+
+    Args:
+        v: Value being validated
+        denylist: (compiled pattern, error message) pairs in check order
+        pattern_set: Result of _build_denylist_set for the same denylist
+    """
+    if pattern_set is not None:
+        hits = pattern_set.Match(v.translate(_ASCII_FOLD_TABLE))
+        if not hits:
+            return
+        denylist = [denylist[i] for i in sorted(hits)]
+
+    for rx, message in denylist:
+        if rx.search(v):
+            raise ValueError(message)
+
+
+def _cached_validator(func):
+    """
+    Memoize a str -> str validator, including the ValueError it raises
+
+    Hot inputs (autocomplete, map refreshes) repeat the same values; a hit
+    is one dict lookup instead of the full regex gauntlet. Rejections are
+    cached as their error message so failures are served from cache too.
+
+    Args:
+        func: Validator taking the stripped value
+
+    Returns:
+        Wrapped validator exposing cache_info() and cache_clear()
+    """
+    @lru_cache(maxsize=4096)
+    def outcome(v):
+        try:
+            return func(v), None
+        except ValueError as e:
+            return None, str(e)
+
+    @wraps(func)
+    def validate(v):
+        result, error = outcome(v)
+        if error is not None:
+            raise ValueError(error)
+        return result
+
+    validate.cache_info = outcome.cache_info
+    validate.cache_clear = outcome.cache_clear
+    return validate
+
+
+_LOCATION_DENYLIST = (
+    [(rx, "Invalid location format: suspicious SQL-like syntax detected") for rx in _SQL_RES]
+    + [(rx, "Invalid location format: shell metacharacters not allowed") for rx in _CMD_RES]
+    + [(rx, "Invalid location format: HTML/JavaScript not allowed") for rx in _XSS_RES]
+)
+_LOCATION_DENYLIST_SET = _build_denylist_set(_LOCATION_DENYLIST)
+
+_QUERY_DENYLIST = (
+    [(rx, "Invalid search query: suspicious SQL-like syntax detected") for rx in _DANGEROUS_SQL_RES]
+    + [(rx, "Invalid search query: prompt injection detected") for rx in _PROMPT_RES]
+    + [(rx, "Invalid search query: HTML/JavaScript not allowed") for rx in _QUERY_XSS_RES]
+    + [(_SHELL_META_RE, "Invalid search query: shell metacharacters not allowed")]
+)
+_QUERY_DENYLIST_SET = _build_denylist_set(_QUERY_DENYLIST)
+
+# Literal substring checks, grouped by the error they raise. Each scanner
+# finds every category present in one pass; callers scan the lowercased
+# value, which leaves these case-invariant or lowercase tokens unchanged.
+_LOCATION_LITERALS = LiteralScanner({
+    "null": ['\x00', '%00'],
+    "newline": ['\r', '\n', '%0d', '%0a'],
+    "url": ['http://', 'https://', 'file://', 'ftp://', 'data:', 'javascript:'],
+    "internal": ['localhost', '127.0.0.1', '0.0.0.0', '169.254', 'internal'],
+    "traversal": ['..', '%2e%2e'],
+    "params": ['&', '?', '#'],
+    "encoded": ['%00', '%0d', '%0a', '%26', '%3f', '%23'],
+    "bidi": ['\u202e', '\u202d', '\u200e', '\u200f'],
+})
+
+_QUERY_LITERALS = LiteralScanner({
+    "null": ['\x00', '%00'],
+    "newline": ['\r', '\n'],
+})
+
+_LANGUAGE_LITERALS = LiteralScanner({
+    "null": ['\x00', '%00'],
+    "newline": ['\r', '\n', '%0d', '%0a'],
+    # Semicolons are handled separately: allowed for the quality factor
+    "shell": ['&', '|', '`', '$', '(', ')'],
+})
+
+# Plain ASCII place names ("New York", "Stratford-upon-Avon") are the common
+# case. Input drawn only from this charset cannot contain a scheme, IP,
+# markup, shell metacharacter or encoded byte, and always passes the
+# allowlist, so only the word-level checks below can still reject it.
+# Apostrophes are left out: they always trip the SQL quote check.
+_SAFE_LOC_CHARSET = frozenset(string.ascii_letters + " -,.")
+_SAFE_LOC_DENYLIST = (
+    [(re.compile(r'localhost|internal'), "Invalid location format: internal hostnames not allowed")]
+    + [(rx, message) for rx, message in _LOCATION_DENYLIST
+       if rx is _SQL_RES[2] or rx in _SQL_RES[4:]]  # '--' comments and SQL keywords
+    + [(re.compile(r'\.\.'), "Invalid location format: path traversal not allowed")]
+)
+
+# Every character a literal, quote, shell or markup check keys on. Names
+# containing none of them (including non-ASCII ones like "Zürich") can
+# only fail the digit, word and allowlist checks.
+_LOC_FORBIDDEN_CHARSET = frozenset(
+    '\x00\r\n%:;&|`$()<>=?#\'"'
+    '\u202e\u202d\u200e\u200f'
+)
+_LOC_INTERNAL_RE = re.compile(r'localhost|127\.0\.0\.1|0\.0\.0\.0|169\.254|internal')
+# '--' plus the SQL keyword checks in one scan (';' is a forbidden char)
+_LOC_SQL_WORD_RE = re.compile(r'--|\b(?:union|select|drop|delete|insert|update)\b', re.IGNORECASE)
+
+# Accept-Language values from this charset cannot contain null bytes,
+# CRLF or shell metacharacters
+_SAFE_LANG_CHARSET = frozenset(string.ascii_letters + string.digits + "-,;=. ")
+
+
+@_cached_validator
+def _validate_location(v: str) -> str:
+    """Run the location checks on a stripped value (see LocationInput)"""
+    v_lower = v.lower()
+
+    # Fast path: skip the full gauntlet for plain ASCII names
+    if v and v.isascii() and _SAFE_LOC_CHARSET.issuperset(v):
+        for rx, message in _SAFE_LOC_DENYLIST:
+            if rx.search(v_lower):
+                raise ValueError(message)
+        return v
+
+    # Second fast path: no forbidden character anywhere in the value
+    if _LOC_FORBIDDEN_CHARSET.isdisjoint(v):
+        if _IP_RE.search(v):
+            raise ValueError("Invalid location format: IP addresses not allowed")
+        if _LOC_INTERNAL_RE.search(v_lower):
+            raise ValueError("Invalid location format: internal hostnames not allowed")
+        if _LOC_SQL_WORD_RE.search(v):
+            raise ValueError("Invalid location format: suspicious SQL-like syntax detected")
+        if '..' in v:
+            raise ValueError("Invalid location format: path traversal not allowed")
+        if not _ALLOWLIST_RE.match(v):
+            raise ValueError("Invalid location format: only letters, spaces, hyphens, apostrophes, and commas allowed")
+        return v
+
+    # Find every denylisted literal token in a single pass
+    literals = _LOCATION_LITERALS.scan(v_lower)
+
+    # Check for null bytes
+    if "null" in literals:
+        raise ValueError("Invalid location format: null bytes not allowed")
+
+    # Check for newline/carriage return (header injection)
+    if "newline" in literals:
+        raise ValueError("Invalid location format: newline characters not allowed")
+
+    # Check for URL/URI schemes (SSRF prevention)
+    if "url" in literals:
+        raise ValueError("Invalid location format: URLs not allowed")
+
+    # Check for IP addresses (SSRF prevention)
+    if _IP_RE.search(v):
+        raise ValueError("Invalid location format: IP addresses not allowed")
+
+    # Check for localhost/internal hostnames (SSRF prevention)
+    if "internal" in literals:
+        raise ValueError("Invalid location format: internal hostnames not allowed")
+
+    # Check for SQL injection, command injection and XSS patterns
+    _check_denylist(v, _LOCATION_DENYLIST, _LOCATION_DENYLIST_SET)
+
+    # Check for path traversal
+    if "traversal" in literals:
+        raise ValueError("Invalid location format: path traversal not allowed")
+
+    # Check for URL parameter injection
+    if "params" in literals:
+        raise ValueError("Invalid location format: URL parameters not allowed")
+
+    # Check for encoded characters that might bypass filters
+    if "encoded" in literals:
+        raise ValueError("Invalid location format: encoded characters not allowed")
+
+    # Check for bidirectional override characters (Unicode exploits)
+    if "bidi" in literals:
+        raise ValueError("Invalid location format: bidirectional override characters not allowed")
+
+    # Allowlist pattern: letters (Unicode), spaces, hyphens, apostrophes, commas
+    # This is the positive validation after all negative checks
+    if not _ALLOWLIST_RE.match(v):
+        raise ValueError("Invalid location format: only letters, spaces, hyphens, apostrophes, and commas allowed")
+
+    return v
+
+
+def validate_location_input(v: str) -> str:
+    """
+    Validate a location without constructing a LocationInput model
+
+    Applies the model's 2-100 character limit and its validator, for
+    hot paths that only need the cleaned value.
+
+    Args:
+        v: Raw location
+
+    Returns:
+        Stripped, validated location
+
+    Raises:
+        ValueError: If the value is invalid
+    """
+    if not v or not isinstance(v, str):
+        raise ValueError("Location must be a non-empty string")
+    if not 2 <= len(v) <= 100:
+        raise ValueError("Location must be between 2 and 100 characters")
+
+    # Checks are memoized on the stripped value
+    return _validate_location(v.strip())
+
 
 class LocationInput(BaseModel):
     """
@@ -38,7 +418,8 @@ class LocationInput(BaseModel):
     """
     location: str = Field(..., min_length=2, max_length=100)
 
-    @validator('location')
+    @field_validator('location')
+    @classmethod
     def validate_location(cls, v):
         """
         Validate location using allowlist approach.
@@ -50,108 +431,52 @@ class LocationInput(BaseModel):
         - Apostrophes (for names like "L'Aquila")
         - Commas (for "City, State" format)
         """
-        if not v or not isinstance(v, str):
-            raise ValueError("Location must be a non-empty string")
+        return validate_location_input(v)
 
-        # Remove leading/trailing whitespace
-        v = v.strip()
 
-        # Check for null bytes
-        if '\x00' in v or '%00' in v:
-            raise ValueError("Invalid location format: null bytes not allowed")
+@_cached_validator
+def _validate_query(v: str) -> str:
+    """Run the search query checks on a stripped value (see SearchQuery)"""
+    literals = _QUERY_LITERALS.scan(v)
 
-        # Check for newline/carriage return (header injection)
-        if '\r' in v or '\n' in v or '%0d' in v.lower() or '%0a' in v.lower():
-            raise ValueError("Invalid location format: newline characters not allowed")
+    # Check for null bytes
+    if "null" in literals:
+        raise ValueError("Invalid search query: null bytes not allowed")
 
-        # Check for URL/URI schemes (SSRF prevention)
-        url_schemes = ['http://', 'https://', 'file://', 'ftp://', 'data:', 'javascript:']
-        if any(scheme in v.lower() for scheme in url_schemes):
-            raise ValueError("Invalid location format: URLs not allowed")
+    # Check for newline/carriage return
+    if "newline" in literals:
+        raise ValueError("Invalid search query: newline characters not allowed")
 
-        # Check for IP addresses (SSRF prevention)
-        ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-        if re.search(ip_pattern, v):
-            raise ValueError("Invalid location format: IP addresses not allowed")
+    # Check for SQL injection (more lenient than location for natural
+    # queries), prompt injection, XSS and command injection patterns
+    _check_denylist(v, _QUERY_DENYLIST, _QUERY_DENYLIST_SET)
 
-        # Check for localhost/internal hostnames (SSRF prevention)
-        internal_hosts = ['localhost', '127.0.0.1', '0.0.0.0', '169.254', 'internal']
-        if any(host in v.lower() for host in internal_hosts):
-            raise ValueError("Invalid location format: internal hostnames not allowed")
+    return v
 
-        # Check for SQL injection patterns
-        sql_patterns = [
-            r"('|(\\'))",  # Single quotes
-            r'("|(\\"))',  # Double quotes
-            r'(;|--)',     # SQL terminators/comments
-            r'\bor\b.*=.*',  # OR clauses
-            r'\bunion\b',    # UNION statements
-            r'\bselect\b',   # SELECT statements
-            r'\bdrop\b',     # DROP statements
-            r'\bdelete\b',   # DELETE statements
-            r'\binsert\b',   # INSERT statements
-            r'\bupdate\b',   # UPDATE statements
-        ]
-
-        for pattern in sql_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Invalid location format: suspicious SQL-like syntax detected")
-
-        # Check for command injection patterns
-        command_patterns = [
-            r'[;&|`$]',        # Shell metacharacters
-            r'\$\(',           # Command substitution
-            r'`',              # Backticks
-            r'\|\s*\w+',       # Pipes
-            r'&&|\|\|',        # Logical operators
-        ]
-
-        for pattern in command_patterns:
-            if re.search(pattern, v):
-                raise ValueError("Invalid location format: shell metacharacters not allowed")
-
-        # Check for XSS patterns
-        xss_patterns = [
-            r'<script',
-            r'javascript:',
-            r'onerror\s*=',
-            r'onload\s*=',
-            r'<iframe',
-            r'<img',
-            r'<svg',
-            r'<object',
-            r'<embed',
-        ]
-
-        for pattern in xss_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Invalid location format: HTML/JavaScript not allowed")
-
-        # Check for path traversal
-        if '..' in v or '%2e%2e' in v.lower():
-            raise ValueError("Invalid location format: path traversal not allowed")
 
-        # Check for URL parameter injection
-        if '&' in v or '?' in v or '#' in v:
-            raise ValueError("Invalid location format: URL parameters not allowed")
+def validate_search_query(v: str) -> str:
+    """
+    Validate a search query without constructing a SearchQuery model
+
+    Applies the model's 3-500 character limit and its validator, for
+    hot paths that only need the cleaned value.
 
-        # Check for encoded characters that might bypass filters
-        encoded_chars = ['%00', '%0d', '%0a', '%26', '%3f', '%23']
-        if any(char in v.lower() for char in encoded_chars):
-            raise ValueError("Invalid location format: encoded characters not allowed")
+    Args:
+        v: Raw search query
 
-        # Check for bidirectional override characters (Unicode exploits)
-        unicode_exploits = ['\u202e', '\u202d', '\u200e', '\u200f']
-        if any(char in v for char in unicode_exploits):
-            raise ValueError("Invalid location format: bidirectional override characters not allowed")
+    Returns:
+        Stripped, validated search query
 
-        # Allowlist pattern: letters (Unicode), spaces, hyphens, apostrophes, commas
-        # This is the positive validation after all negative checks
-        allowlist_pattern = r"^[\w\s\-',\.]+$"
-        if not re.match(allowlist_pattern, v, re.UNICODE):
-            raise ValueError("Invalid location format: only letters, spaces, hyphens, apostrophes, and commas allowed")
+    Raises:
+        ValueError: If the value is invalid
+    """
+    if not v or not isinstance(v, str):
+        raise ValueError("Search query must be a non-empty string")
+    if not 3 <= len(v) <= 500:
+        raise ValueError("Search query must be between 3 and 500 characters")
 
-        return v
+    # Checks are memoized on the stripped value
+    return _validate_query(v.strip())
 
 
 class SearchQuery(BaseModel):
@@ -164,73 +489,72 @@ class SearchQuery(BaseModel):
     """
     query: str = Field(..., min_length=3, max_length=500)
 
-    @validator('query')
+    @field_validator('query')
+    @classmethod
     def validate_query(cls, v):
         """
         Validate search query using comprehensive security checks.
         """
-        if not v or not isinstance(v, str):
-            raise ValueError("Search query must be a non-empty string")
+        return validate_search_query(v)
 
-        # Remove leading/trailing whitespace
-        v = v.strip()
+
+@_cached_validator
+def _validate_language(v: str) -> str:
+    """Run the language code checks on a stripped value (see AcceptLanguage)"""
+    # Fast path: the injection checks cannot match plain ASCII tags
+    if not (v.isascii() and _SAFE_LANG_CHARSET.issuperset(v)):
+        literals = _LANGUAGE_LITERALS.scan(v.lower())
 
         # Check for null bytes
-        if '\x00' in v or '%00' in v:
-            raise ValueError("Invalid search query: null bytes not allowed")
-
-        # Check for newline/carriage return
-        if '\r' in v or '\n' in v:
-            raise ValueError("Invalid search query: newline characters not allowed")
-
-        # Check for SQL injection patterns (more lenient than location for natural queries)
-        dangerous_sql = [
-            r";\s*(drop|delete|update|insert)\s+",
-            r"'\s*or\s*'1'\s*=\s*'1",
-            r"--\s*$",
-            r";\s*--",
-            r"union\s+select",
-        ]
-
-        for pattern in dangerous_sql:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Invalid search query: suspicious SQL-like syntax detected")
-
-        # Check for prompt injection patterns
-        prompt_injection = [
-            r'ignore\s+previous\s+instructions',
-            r'system\s*:\s*override',
-            r'forget\s+everything',
-            r'\[inst\]',
-            r'\[/inst\]',
-            r'\\n\\nhuman:',
-            r'developer\s+mode',
-            r'bypass\s+all\s+restrictions',
-            r'reveal\s+system\s+prompt',
-        ]
-
-        for pattern in prompt_injection:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Invalid search query: prompt injection detected")
-
-        # Check for XSS patterns
-        xss_patterns = [
-            r'<script',
-            r'javascript:',
-            r'onerror\s*=',
-            r'onload\s*=',
-            r'<iframe',
-        ]
-
-        for pattern in xss_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Invalid search query: HTML/JavaScript not allowed")
+        if "null" in literals:
+            raise ValueError("Invalid language code: null bytes not allowed")
+
+        # Check for header injection (CRLF)
+        if "newline" in literals:
+            raise ValueError("Invalid language code: newline characters not allowed")
 
         # Check for command injection
-        if re.search(r'[;&|`$]', v):
-            raise ValueError("Invalid search query: shell metacharacters not allowed")
+        # Allow semicolon only in quality factor context (;q=)
+        if "shell" in literals:
+            raise ValueError("Invalid language code: shell metacharacters not allowed")
 
-        return v
+    # If semicolon exists, ensure it's only for quality factor
+    if ';' in v:
+        if not _QUALITY_RE.search(v):
+            raise ValueError("Invalid language code: semicolon only allowed for quality factor")
+
+    # RFC 5646 pattern validation
+    # Format: language[-script][-region][;q=value][,language[-script][-region][;q=value]]*
+    # Simplified pattern for common use cases
+    if not _RFC5646_RE.match(v):
+        raise ValueError("Invalid language code: must follow RFC 5646 format (e.g., en-US, fr-FR)")
+
+    return v
+
+
+def validate_accept_language(v: str) -> str:
+    """
+    Validate an Accept-Language value without constructing an AcceptLanguage model
+
+    Applies the model's 35 character limit and its validator, for
+    hot paths that only need the cleaned value.
+
+    Args:
+        v: Raw Accept-Language value
+
+    Returns:
+        Stripped, validated Accept-Language value
+
+    Raises:
+        ValueError: If the value is invalid
+    """
+    if not v or not isinstance(v, str):
+        raise ValueError("Language code must be a non-empty string")
+    if len(v) > 35:
+        raise ValueError("Language code must be at most 35 characters")
+
+    # Checks are memoized on the stripped value
+    return _validate_language(v.strip())
 
 
 class AcceptLanguage(BaseModel):
@@ -244,7 +568,8 @@ class AcceptLanguage(BaseModel):
     """
     language: str = Field(..., max_length=35)
 
-    @validator('language')
+    @field_validator('language')
+    @classmethod
     def validate_language(cls, v):
         """
         Validate language code according to RFC 5646.
@@ -252,40 +577,7 @@ class AcceptLanguage(BaseModel):
         Format: language[-region][;q=quality]
         Example: en-US, fr-FR, en-US,fr;q=0.9
         """
-        if not v or not isinstance(v, str):
-            raise ValueError("Language code must be a non-empty string")
-
-        # Remove leading/trailing whitespace
-        v = v.strip()
-
-        # Check for null bytes
-        if '\x00' in v or '%00' in v:
-            raise ValueError("Invalid language code: null bytes not allowed")
-
-        # Check for header injection (CRLF)
-        if '\r' in v or '\n' in v or '%0d' in v.lower() or '%0a' in v.lower():
-            raise ValueError("Invalid language code: newline characters not allowed")
-
-        # Check for command injection
-        command_chars = [';', '&', '|', '`', '$', '(', ')']
-        # Allow semicolon only in quality factor context (;q=)
-        if any(char in v for char in command_chars if char != ';'):
-            raise ValueError("Invalid language code: shell metacharacters not allowed")
-
-        # If semicolon exists, ensure it's only for quality factor
-        if ';' in v:
-            if not re.search(r';\s*q\s*=\s*[0-9.]+', v):
-                raise ValueError("Invalid language code: semicolon only allowed for quality factor")
-
-        # RFC 5646 pattern validation
-        # Format: language[-script][-region][;q=value][,language[-script][-region][;q=value]]*
-        # Simplified pattern for common use cases
-        rfc5646_pattern = r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?(-[a-zA-Z]{2})?(\s*;\s*q\s*=\s*[0-1](\.\d{1,3})?)?(,\s*[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?(-[a-zA-Z]{2})?(\s*;\s*q\s*=\s*[0-1](\.\d{1,3})?)?)*$'
-
-        if not re.match(rfc5646_pattern, v):
-            raise ValueError("Invalid language code: must follow RFC 5646 format (e.g., en-US, fr-FR)")
-
-        return v
+        return validate_accept_language(v)
 
 
 class FetchUrl(BaseModel):
@@ -300,7 +592,8 @@ class FetchUrl(BaseModel):
     """
     url: str = Field(..., max_length=2048)
 
-    @validator('url')
+    @field_validator('url')
+    @classmethod
     def validate_url(cls, v):
         """
         Validate URL with comprehensive SSRF and security checks.
@@ -310,13 +603,14 @@ class FetchUrl(BaseModel):
 
         # Remove leading/trailing whitespace
         v = v.strip()
+        v_lower = v.lower()
 
         # Check for null bytes
         if '\x00' in v or '%00' in v:
             raise ValueError("Invalid URL: null bytes not allowed")
 
         # Check for newline/carriage return (header injection)
-        if '\r' in v or '\n' in v or '%0d' in v.lower() or '%0a' in v.lower():
+        if '\r' in v or '\n' in v or '%0d' in v_lower or '%0a' in v_lower:
             raise ValueError("Invalid URL: newline characters not allowed")
 
         # Enforce max length (before parsing, to prevent DoS)
@@ -330,13 +624,14 @@ class FetchUrl(BaseModel):
             raise ValueError(f"Invalid URL format: {e}")
 
         # Scheme whitelist: only http and https allowed
+        # (urlparse already lowercases the scheme and hostname)
         allowed_schemes = ['http', 'https']
-        if parsed.scheme.lower() not in allowed_schemes:
+        if parsed.scheme not in allowed_schemes:
             raise ValueError(f"Invalid URL: only http and https schemes allowed (got: {parsed.scheme})")
 
         # Reject blocked schemes explicitly (defense in depth)
         blocked_schemes = ['file', 'ftp', 'data', 'javascript', 'mailto', 'ssh', 'telnet']
-        if parsed.scheme.lower() in blocked_schemes:
+        if parsed.scheme in blocked_schemes:
             raise ValueError(f"Invalid URL: {parsed.scheme}:// scheme is not allowed")
 
         # Ensure netloc exists (http:// requires a host)
@@ -371,7 +666,7 @@ class FetchUrl(BaseModel):
         # Block localhost and local-only hostnames
         blocked_hostnames = ['localhost', 'localhost.localdomain', 'ip6-localhost',
                             'ip6-loopback', 'localhost6', 'localhost6.localdomain6']
-        if hostname.lower() in blocked_hostnames:
+        if hostname in blocked_hostnames:
             raise ValueError("Invalid URL: localhost and local hostnames are not allowed")
 
         # Block 0.0.0.0 explicitly
@@ -415,56 +710,33 @@ class FetchUrl(BaseModel):
             pass
 
         # DNS rebinding protection: check for internal hostnames that might resolve to internal IPs
-        suspicious_patterns = [
-            r'\binternal\b',
-            r'\bintranet\b',
-            r'\bprivate\b',
-            r'\blocal\b',
-            r'\bad\b',  # Active Directory domain
-            r'\bcorp\b',
-            r'\bdev\b',
-            r'\btest\b',
-            r'\bstaging\b',
-        ]
-
-        hostname_lower = hostname.lower()
-        for pattern in suspicious_patterns:
-            if re.search(pattern, hostname_lower):
+        for rx in _SUSPICIOUS_HOST_RES:
+            if rx.search(hostname):
                 # Allow if it's a well-known public domain with these words
                 # (e.g., 'developer.mozilla.org' is okay)
                 public_domains = ['developer.mozilla.org', 'developers.google.com',
                                 'docs.python.org', 'localhost', 'local']
-                if not any(public in hostname_lower for public in public_domains):
+                if not any(public in hostname for public in public_domains):
                     # More lenient check - only block if it looks like an internal hostname
                     # (has no TLD or has an internal-like TLD)
-                    if '.' in hostname and not hostname_lower.split('.')[-1] in ['com', 'org', 'net', 'io', 'co', 'gov', 'edu', 'info', 'biz']:
-                        if hostname_lower.split('.')[-1] in ['local', 'internal', 'private', 'corp', 'intranet']:
+                    tld = hostname.rsplit('.', 1)[-1]
+                    if '.' in hostname and tld not in ['com', 'org', 'net', 'io', 'co', 'gov', 'edu', 'info', 'biz']:
+                        if tld in ['local', 'internal', 'private', 'corp', 'intranet']:
                             raise ValueError(f"Invalid URL: internal-looking hostname not allowed")
 
         # Check for IP address in URL path/query (potential SSRF bypass)
         # Some proxies might rewrite host headers based on path content
-        ip_in_url = re.search(r'//(localhost|127\.|10\.|172\.(1[6-9]|2[0-9]|3[01])\.|192\.168\.|169\.254\.|0\.0\.0\.0)', v.lower())
+        ip_in_url = _IP_IN_URL_RE.search(v_lower)
         if ip_in_url:
             raise ValueError("Invalid URL: IP address detected in URL")
 
         # Check for common SSRF bypass patterns
-        ssrf_bypasses = [
-            r'@localhost',          # http://user@localhost/
-            r'@127\.0\.0\.1',       # http://user@127.0.0.1/
-            r'@0\.0\.0\.0',         # http://user@0.0.0.0/
-            r'@169\.254\.',         # http://user@169.254.1.1/
-            r'::1',                 # IPv6 loopback
-            r'\[::1\]',             # Bracketed IPv6 loopback
-            r'\[::\]',              # IPv6 unspecified
-            r'\[fc00:',             # ULA prefix
-        ]
-
-        for pattern in ssrf_bypasses:
-            if re.search(pattern, v.lower()):
+        for rx in _SSRF_BYPASS_RES:
+            if rx.search(v_lower):
                 raise ValueError("Invalid URL: SSRF bypass pattern detected")
 
         # Check for URL encoding bypass attempts
-        if '%2f' in v.lower() or '%5c' in v.lower():
+        if '%2f' in v_lower or '%5c' in v_lower:
             raise ValueError("Invalid URL: encoded path separators not allowed")
 
         # Check for command injection in URL
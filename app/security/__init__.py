@@ -5,6 +5,7 @@ OWASP API Security Top 10 compliant implementations
 from .ssrf_protection import SSRFProtection
 from .error_handler import SafeErrorHandler
 from .request_signing import RequestSigner
+from .literal_scanner import LiteralScanner
 from .sanitizers import (
     sanitize_url_parameter,
     sanitize_api_response,
@@ -16,6 +17,7 @@ __all__ = [
     "SSRFProtection",
     "SafeErrorHandler",
     "RequestSigner",
+    "LiteralScanner",
     "sanitize_url_parameter",
     "sanitize_api_response",
     "sanitize_header_value",
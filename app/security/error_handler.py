@@ -8,38 +8,93 @@ Prevents:
 - Sensitive data in error messages
 - Internal implementation details exposure
 """
-import re
+import json
 import logging
 import traceback
+from functools import lru_cache
+from ipaddress import ip_address
 from typing import Dict, Any
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
+from app.security.regex_compat import compile_linear, scope_inline_flags
+
 logger = logging.getLogger(__name__)
 
 
+def _compile_sensitive_patterns(patterns):
+    """
+    Compile redaction patterns plus one alternation that detects any of them
+
+    Error text can echo attacker input, so patterns are compiled with RE2
+    (linear time) via compile_linear; if google-re2 is missing they fall
+    back to re and carry no such guarantee.
+
+    The alternation only gates the substitutions: applied on its own,
+    leftmost-first matching would let an earlier-starting pattern consume
+    the prefix of a secret ("key: password=...") and leave the rest
+    unredacted, so matches are still replaced pattern by pattern.
+
+    Args:
+        patterns: (regex, replacement) pairs
+
+    Returns:
+        Tuple of (combined pattern, list of (compiled pattern, replacement))
+    """
+    combined = compile_linear('|'.join(scope_inline_flags(pattern) for pattern, _ in patterns))
+    compiled = [(compile_linear(pattern), replacement) for pattern, replacement in patterns]
+    return combined, compiled
+
+
+@lru_cache(maxsize=1024)
+def _is_private_ip(host: str) -> bool:
+    """
+    Check whether a client address is in a private/internal range
+
+    Covers RFC 1918, loopback, link-local and IPv6 ULA; cached because
+    the same few proxy/client addresses recur on every error.
+
+    Args:
+        host: Client host string
+
+    Returns:
+        True for private addresses, False otherwise (including non-IPs)
+    """
+    try:
+        return ip_address(host).is_private
+    except ValueError:
+        return False
+
+
 class SafeErrorHandler:
     """
     Sanitize error responses to prevent information disclosure
     """
 
-    # Patterns to redact from error messages (pattern, replacement)
+    # Patterns to redact from error messages (pattern, replacement).
+    # Spans that end in a literal are bounded so a backtracking engine
+    # cannot go quadratic on long runs without the terminator; secret
+    # values stay unbounded (their classes don't overlap what follows)
+    # so long tokens are redacted whole.
     SENSITIVE_PATTERNS = [
-        (r'/[\w/]+\.py', '[REDACTED_FILE]'),                    # File paths
+        (r'/[\w/]{1,255}\.py', '[REDACTED_FILE]'),              # File paths
         (r'line \d+', '[REDACTED_LINE]'),                       # Line numbers
         (r'sk-[a-zA-Z0-9-]{20,}', '[REDACTED_SK_KEY]'),  # OpenAI style keys (match shorter keys too)
-        (r'(?i)(password|passwd|pwd)[\s:=]+[\w\S]+', '[REDACTED_PASSWORD]'),  # Passwords
+        (r'(?i)(password|passwd|pwd)[\s:=]+\S+', '[REDACTED_PASSWORD]'),  # Passwords
         (r'(?i)(api[_-]?key|apikey|key)[\s:=]+[\w-]+', '[REDACTED_API_KEY]'),   # API keys
         (r'(?i)(token|bearer)[\s:=]+[\w.-]+', '[REDACTED_TOKEN]'),  # Tokens
         (r'(?i)(secret|secret[_-]?key)[\s:=]+[\w-]+', '[REDACTED_SECRET]'),  # Secrets
-        (r'SELECT .+ FROM', '[REDACTED_SQL]'),                 # SQL queries
-        (r'UPDATE .+ SET', '[REDACTED_SQL]'),                  # SQL updates
+        (r'SELECT .{1,1000} FROM', '[REDACTED_SQL]'),          # SQL queries
+        (r'UPDATE .{1,1000} SET', '[REDACTED_SQL]'),           # SQL updates
         (r'DELETE FROM', '[REDACTED_SQL]'),                    # SQL deletes
         (r'INSERT INTO', '[REDACTED_SQL]'),                    # SQL inserts
         (r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b', '[REDACTED_CARD]'),  # Credit card
         (r'\b\d{3}-\d{2}-\d{4}\b', '[REDACTED_SSN]'),  # SSN
     ]
 
+    # Compiled once per class; clean messages cost a single combined scan
+    _SENSITIVE_ANY, _SENSITIVE_RES = _compile_sensitive_patterns(SENSITIVE_PATTERNS)
+
     # Generic error messages by status code
     GENERIC_MESSAGES = {
         400: "Bad request",
@@ -55,6 +110,16 @@ class SafeErrorHandler:
         503: "Service unavailable",
     }
 
+    # Non-debug responses are fixed per status code, so their bodies are
+    # serialized once here (in JSONResponse's compact form) and reused
+    _PRECOMPUTED_BODIES = {
+        status_code: json.dumps(
+            {"error": True, "status_code": status_code, "message": message},
+            separators=(",", ":")
+        ).encode()
+        for status_code, message in GENERIC_MESSAGES.items()
+    }
+
     def __init__(self, debug_mode: bool = False):
         """
         Initialize error handler
@@ -69,7 +134,7 @@ class SafeErrorHandler:
         error: Exception,
         status_code: int = 500,
         request: Request = None
-    ) -> JSONResponse:
+    ) -> Response:
         """
         Handle error and return sanitized response
 
@@ -84,6 +149,15 @@ class SafeErrorHandler:
         # Log the actual error with full details (secure logs only)
         self._log_error_securely(error, status_code, request)
 
+        if not self.debug_mode:
+            body = self._PRECOMPUTED_BODIES.get(status_code)
+            if body is not None:
+                return Response(
+                    content=body,
+                    status_code=status_code,
+                    media_type="application/json"
+                )
+
         # Generate safe error response
         error_response = self._create_safe_response(error, status_code)
 
@@ -122,11 +196,13 @@ class SafeErrorHandler:
         Returns:
             Sanitized error message
         """
-        sanitized = message
+        # One pass decides whether any pattern can apply
+        if not self._SENSITIVE_ANY.search(message):
+            return message
 
-        # Apply all redaction patterns
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            sanitized = re.sub(pattern, replacement, sanitized)
+        sanitized = message
+        for pattern, replacement in self._SENSITIVE_RES:
+            sanitized = pattern.sub(replacement, sanitized)
 
         return sanitized
 
@@ -189,14 +265,14 @@ class SafeErrorHandler:
         # Check for forwarded IP
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            # Take first IP (client)
-            return forwarded.split(",")[0].strip()
+            # Take first IP (client) without splitting the whole header
+            return forwarded.partition(",")[0].strip()
 
         # Fall back to direct connection
         client_host = request.client.host if request.client else "unknown"
 
         # Sanitize internal IPs
-        if client_host.startswith("10.") or client_host.startswith("172.") or client_host.startswith("192.168."):
+        if _is_private_ip(client_host):
             return "[INTERNAL]"
 
         return client_host
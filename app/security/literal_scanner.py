@@ -0,0 +1,85 @@
+"""
+Literal Token Scanner
+Single-pass detection of denylisted substrings
+
+Validators check dozens of fixed substrings (URL schemes, encoded
+characters, XML entity keywords). Rather than one `in` scan per token,
+all tokens are loaded into an Aho-Corasick automaton that reports every
+match in one pass over the input.
+"""
+from typing import Dict, FrozenSet, Iterable, Set, Union
+
+# pyahocorasick is declared in requirements.txt; without it scan() falls
+# back to per-token substring checks that report the same categories
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+class LiteralScanner:
+    """
+    Report which categories of literal tokens occur in a string
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Initialize scanner
+
+        Args:
+            categories: Mapping of category name to the literal tokens that
+                belong to it. A token may appear in several categories.
+        """
+        token_categories: Dict[str, Set[str]] = {}
+        for category, tokens in categories.items():
+            for token in tokens:
+                token_categories.setdefault(token, set()).add(category)
+
+        self._tokens: Dict[str, FrozenSet[str]] = {
+            token: frozenset(cats) for token, cats in token_categories.items()
+        }
+        # UTF-8 forms, so raw request bodies can be scanned without decoding
+        self._byte_tokens: Dict[bytes, FrozenSet[str]] = {
+            token.encode("utf-8"): cats for token, cats in self._tokens.items()
+        }
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for token, cats in self._tokens.items():
+                automaton.add_word(token, cats)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, text: Union[str, bytes]) -> Set[str]:
+        """
+        Find the categories whose tokens occur in text
+
+        Args:
+            text: String or UTF-8 bytes to scan (callers lowercase it
+                first for case-insensitive tokens)
+
+        Returns:
+            Set of matched category names (empty if clean)
+        """
+        found: Set[str] = set()
+
+        if isinstance(text, bytes):
+            # The automaton is built over str; bytes.__contains__ is a
+            # memchr-backed search, so a few byte tokens stay cheap
+            for token, cats in self._byte_tokens.items():
+                if token in text:
+                    found |= cats
+            return found
+
+        if self._automaton is not None:
+            for _, cats in self._automaton.iter(text):
+                found |= cats
+            return found
+
+        for token, cats in self._tokens.items():
+            if token in text:
+                found |= cats
+        return found
@@ -0,0 +1,112 @@
+"""
+RE2 Compatibility Helpers
+Linear-time matching for patterns run over attacker-controlled text
+
+Python's backtracking engine can be driven into quadratic (or worse)
+behavior by crafted input; RE2 guarantees linear time. RE2's \\s, \\w
+and \\d (and their negations) are ASCII-only, so patterns written for
+Python are widened to the equivalent Unicode classes before they are
+handed to RE2.
+
+google-re2 is listed in requirements.txt. The import stays optional so
+the module still loads without it, but the re fallback is a backtracking
+engine: without RE2 the linear-time guarantee does not hold.
+"""
+import re
+
+# Optional RE2 import - linear-time DFA matching
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+# Unicode equivalents of Python's \s, \w and \d, without the brackets so
+# they can be spliced into an existing character class
+_UNICODE_CLASS_BODIES = {
+    's': r'\s\x{0b}\p{Z}\x{1c}-\x{1f}\x{85}',
+    'w': r'\p{L}\p{N}_',
+    'd': r'\p{Nd}',
+}
+
+_CLASS_ESCAPE_RE = re.compile(r'\\.|\[|\]', re.DOTALL)
+
+
+def to_re2_pattern(pattern: str) -> str:
+    """
+    Rewrite a Python regex so RE2 matches \\s, \\w and \\d like Python does
+
+    Args:
+        pattern: Python regex source
+
+    Returns:
+        Equivalent RE2 regex source (word boundaries stay ASCII-only)
+
+    Raises:
+        ValueError: If a negated class (\\S, \\W, \\D) appears inside a
+            character class, which has no spliceable Unicode equivalent
+    """
+    in_class = False
+
+    def _widen(match):
+        nonlocal in_class
+        token = match.group(0)
+        if token == '[':
+            if in_class:
+                return r'\['
+            in_class = True
+            return token
+        if token == ']':
+            in_class = False
+            return token
+        body = _UNICODE_CLASS_BODIES.get(token[1].lower())
+        if body is None:
+            return token
+        if token[1].isupper():
+            if in_class:
+                raise ValueError(f"Cannot widen {token} inside a character class")
+            return f'[^{body}]'
+        return body if in_class else f'[{body}]'
+
+    return _CLASS_ESCAPE_RE.sub(_widen, pattern)
+
+
+def scope_inline_flags(pattern: str) -> str:
+    """
+    Wrap a pattern in a group so it can be joined into an alternation
+
+    Global inline flags are only legal at the start of a whole expression,
+    so a leading (?i) is scoped to the pattern's own group.
+
+    Args:
+        pattern: Regex source, optionally starting with (?i)
+
+    Returns:
+        Non-capturing group matching the same text
+    """
+    if pattern.startswith('(?i)'):
+        return f'(?i:{pattern[4:]})'
+    return f'(?:{pattern})'
+
+
+def compile_linear(pattern: str):
+    """
+    Compile with RE2 when installed, otherwise with the re module
+
+    Only the RE2 result matches in linear time; patterns RE2 cannot
+    express (e.g. backreferences) also fall back to re.
+
+    Args:
+        pattern: Python regex source (flags must be inline, e.g. (?i))
+
+    Returns:
+        Compiled pattern supporting search() and sub()
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(to_re2_pattern(pattern))
+        except (ValueError, re2.error):
+            # Untranslatable here or unsupported by RE2 (e.g. backreferences)
+            pass
+    return re.compile(pattern)
@@ -10,9 +10,120 @@ Sanitization utilities for:
 
 import re
 import html
-from urllib.parse import quote_plus, quote
+import ipaddress
+import socket
+import sys
+from urllib.parse import quote_plus, quote, urlparse
 from typing import Any, Dict, Union
 
+from app.security.regex_compat import RE2_AVAILABLE, compile_linear
+from app.security.ssrf_protection import SSRFProtection, is_internal_ip
+
+
+# Patterns are compiled once at import time; _sanitize_string runs on
+# every string in every API response and should only pay for matching.
+# compile_linear uses RE2 (google-re2, in requirements.txt), so crafted
+# responses cannot drive the lazy .*? and event handler patterns into
+# backtracking blowups. The patterns are also written to stay linear
+# under the re fallback: whitespace runs and handler names are bounded,
+# and tag passes only run up to the last closing tag (see _TAG_PASSES).
+
+_SCRIPT_RE = compile_linear(r'(?is)<script[^>]*>.*?</script>')
+_IFRAME_RE = compile_linear(r'(?is)<iframe[^>]*>.*?</iframe>')
+# Separate passes rather than <(object|embed)...</\1>: RE2 has no
+# backreferences, and one pass per tag keeps every opening tag's scan
+# bounded by its own closing tag
+_OBJECT_RE = compile_linear(r'(?is)<object[^>]*>.*?</object>')
+_EMBED_RE = compile_linear(r'(?is)<embed[^>]*>.*?</embed>')
+
+# Event handlers: quoted values first, then bare values. Handler names
+# are ASCII and under 30 characters; the bounds keep re from rescanning
+# long "onon..." or whitespace runs from every starting position (an
+# ASCII class, since a counted Unicode \w blows up RE2's DFA).
+_QUOTED_HANDLER_RE = compile_linear(r'(?i)\s{0,40}on[a-z0-9_]{1,40}\s*=\s*["\'][^"\']*["\']')
+_BARE_HANDLER_RE = compile_linear(r'(?i)\s{0,40}on[a-z0-9_]{1,40}\s*=\s*\S+')
+
+_JAVASCRIPT_RE = compile_linear(r'(?i)javascript:')
+
+# SQL injection patterns (aggressive)
+_SQL_RES = [compile_linear(f'(?i){p}') for p in (
+    r"'\s*or\s*'1'\s*=\s*'1",
+    r';\s*drop\s+table',
+    r';\s*delete\s+from',
+    r'union\s+select',
+    r'--\s*$',
+)]
+
+# (pattern, closing tag) in application order. A tag pattern can only
+# match up to the last closing tag, so it is applied to that prefix
+# alone: an opening tag with no closing tag after it would otherwise
+# cost re a scan to the end of the string, for every such opening tag.
+_TAG_PASSES = [
+    (_SCRIPT_RE, '</script>'),
+    (_IFRAME_RE, '</iframe>'),
+    (_OBJECT_RE, '</object>'),
+    (_EMBED_RE, '</embed>'),
+]
+_SANITIZE_RES = [
+    _QUOTED_HANDLER_RE, _BARE_HANDLER_RE,
+    _JAVASCRIPT_RE,
+] + _SQL_RES
+
+# Lowercases the way re's IGNORECASE matches the tag letters, one
+# character for one so indices carry over to the original string
+_TAG_FOLD_TABLE = str.maketrans({
+    **{c: c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'},
+    '\u0130': 'i', '\u0131': 'i', '\u017f': 's',
+})
+
+# One scan that matches wherever any pattern above could: a superset of
+# them all (the leading \s* dropped, literal prefixes kept). Clean strings
+# skip the passes entirely; anything it flags still gets the ordered
+# passes, because removing one match can create another
+# (javas<script></script>cript:).
+_SANITIZE_ANY_PATTERN = (
+    r"<(?:script|iframe|object|embed)"
+    r"|on[a-z0-9_]{1,40}\s*="
+    r"|javascript:"
+    r"|'\s*or\s*'1"
+    r"|;\s*(?:drop|delete)"
+    r"|union\s+select"
+    r"|--"
+)
+# For re, a lookahead on the possible first characters rejects most
+# positions with a single class test
+_SANITIZE_ANY_RE = re.compile(f"(?=[<'o;ju-])(?:{_SANITIZE_ANY_PATTERN})", re.IGNORECASE)
+
+# RE2's per-call overhead loses to re on short strings, so it only takes
+# over the scan from this length
+_LINEAR_SCAN_MIN_LENGTH = 128
+_SANITIZE_ANY_LINEAR_RE = (
+    compile_linear(f"(?i){_SANITIZE_ANY_PATTERN}") if RE2_AVAILABLE else _SANITIZE_ANY_RE
+)
+
+# Bound once rather than looked up through the module on every string
+_html_escape = html.escape
+_intern = sys.intern
+
+# Longer strings are rarely repeated verbatim, and a cap keeps attacker
+# supplied text from filling the intern table
+_INTERN_MAX_LENGTH = 40
+
+# sanitize_url_parameter: characters quote_plus never encodes (RFC 3986
+# unreserved), so values made only of these need no quoting
+_URL_UNRESERVED_RE = re.compile(r'[A-Za-z0-9_.~-]+')
+
+# sanitize_header_value: raw and percent-encoded CR, LF and NUL
+_HEADER_DELETE_TABLE = str.maketrans('', '', '\r\n\x00')
+_HEADER_PCT_RE = re.compile(r'%0[da0]', re.IGNORECASE)
+
+# validate_url_safe: schemes that must never be requested
+_DANGEROUS_SCHEMES = frozenset({'file', 'gopher', 'data', 'ftp', 'jar', 'dict'})
+
+# validate_url_safe: hostname blocklist shared with the SSRF module
+# (validate_hostname does no DNS resolution)
+_SSRF_PROTECTION = SSRFProtection()
+
 
 def sanitize_url_parameter(value: str) -> str:
     """
@@ -32,6 +143,10 @@ def sanitize_url_parameter(value: str) -> str:
     if not value:
         return ""
 
+    # Identifiers, tokens and plain words come back unchanged
+    if _URL_UNRESERVED_RE.fullmatch(value):
+        return value
+
     # Use quote_plus to encode special characters and convert spaces to +
     # This prevents parameter injection and ensures safe URL usage
     encoded = quote_plus(value, safe='')
@@ -57,13 +172,39 @@ def sanitize_api_response(response: Union[Dict[str, Any], str]) -> Union[Dict[st
     """
     if isinstance(response, str):
         return _sanitize_string(response)
-    elif isinstance(response, dict):
-        return {k: sanitize_api_response(v) for k, v in response.items()}
-    elif isinstance(response, list):
-        return [sanitize_api_response(item) for item in response]
-    else:
+    if not isinstance(response, (dict, list)):
         return response
 
+    # Walk nested containers with an explicit stack rather than recursion,
+    # so deeply nested payloads cannot raise RecursionError. Each source
+    # container maps to its sanitized copy; the input is left untouched.
+    root = {} if isinstance(response, dict) else []
+    copies = {id(response): root}
+    stack = [(response, root)]
+
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        is_dict = isinstance(target, dict)
+
+        for key, value in items:
+            if isinstance(value, str):
+                value = _sanitize_string(value)
+            elif isinstance(value, (dict, list)):
+                copy = copies.get(id(value))
+                if copy is None:
+                    copy = {} if isinstance(value, dict) else []
+                    copies[id(value)] = copy
+                    stack.append((value, copy))
+                value = copy
+
+            if is_dict:
+                target[key] = value
+            else:
+                target.append(value)
+
+    return root
+
 
 def _sanitize_string(value: str) -> str:
     """
@@ -78,35 +219,30 @@ def _sanitize_string(value: str) -> str:
     if not isinstance(value, str):
         return value
 
-    # Remove script tags
-    value = re.sub(r'<script[^>]*>.*?</script>', '', value, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove iframe tags
-    value = re.sub(r'<iframe[^>]*>.*?</iframe>', '', value, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove object/embed tags
-    value = re.sub(r'<(object|embed)[^>]*>.*?</\1>', '', value, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove event handlers
-    value = re.sub(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', '', value, flags=re.IGNORECASE)
-    value = re.sub(r'\s*on\w+\s*=\s*\S+', '', value, flags=re.IGNORECASE)
-
-    # Remove javascript: protocol
-    value = re.sub(r'javascript:', '', value, flags=re.IGNORECASE)
-
-    # Remove SQL injection patterns (aggressive)
-    sql_patterns = [
-        r"'\s*or\s*'1'\s*=\s*'1",
-        r';\s*drop\s+table',
-        r';\s*delete\s+from',
-        r'union\s+select',
-        r'--\s*$',
-    ]
-    for pattern in sql_patterns:
-        value = re.sub(pattern, '', value, flags=re.IGNORECASE)
-
-    # Escape remaining HTML entities for safety
-    value = html.escape(value, quote=False)
+    # Remove script, iframe and object/embed tags, event handlers, the
+    # javascript: protocol and SQL injection patterns (aggressive)
+    if len(value) < _LINEAR_SCAN_MIN_LENGTH:
+        suspect = _SANITIZE_ANY_RE.search(value)
+    else:
+        suspect = _SANITIZE_ANY_LINEAR_RE.search(value)
+
+    if suspect:
+        for rx, closing_tag in _TAG_PASSES:
+            end = value.translate(_TAG_FOLD_TABLE).rfind(closing_tag)
+            if end >= 0:
+                end += len(closing_tag)
+                value = rx.sub('', value[:end]) + value[end:]
+        for rx in _SANITIZE_RES:
+            value = rx.sub('', value)
+        # Escape remaining HTML entities for safety
+        value = _html_escape(value, quote=False)
+    elif '&' in value or '<' in value or '>' in value:
+        value = _html_escape(value, quote=False)
+
+    # Short values ("Clear", "NW", codes and dates) repeat across and
+    # between responses; interning leaves one shared object per value
+    if len(value) < _INTERN_MAX_LENGTH and type(value) is str:
+        return _intern(value)
 
     return value
 
@@ -130,46 +266,62 @@ def validate_url_safe(url: str, allowed_domains: list = None) -> bool:
     if not url or not isinstance(url, str):
         return False
 
-    # Convert to lowercase for comparison
-    url_lower = url.lower()
+    # Parse once; urlparse lowercases the scheme and hostname, and drops
+    # leading controls/spaces and embedded tabs/newlines as browsers do
+    try:
+        parsed = urlparse(url)
+        hostname = parsed.hostname or ''
+    except ValueError:
+        return False
 
     # Block dangerous protocols
-    dangerous_protocols = ['file://', 'gopher://', 'data:', 'ftp://', 'jar:', 'dict://']
-    if any(proto in url_lower for proto in dangerous_protocols):
+    if parsed.scheme in _DANGEROUS_SCHEMES:
         return False
 
-    # Block localhost and internal IPs
-    internal_hosts = [
-        'localhost',
-        '127.0.0.1',
-        '0.0.0.0',
-        '::1',
-        '169.254',  # Link-local
-        '10.',      # Private network
-        '192.168',  # Private network
-        '172.16',   # Private network (172.16-172.31)
-    ]
-
-    for host in internal_hosts:
-        if host in url_lower:
+    # Block internal IPs by classifying the parsed host, so paths and
+    # hostnames like 10.example.com are not mistaken for them
+    ip = _parse_ip_host(hostname)
+    if ip is not None:
+        if is_internal_ip(ip):
             return False
+    elif not _SSRF_PROTECTION.validate_hostname(hostname):
+        # localhost, cloud metadata names, or no host at all
+        return False
 
     # If allowlist provided, check domain
     if allowed_domains:
-        from urllib.parse import urlparse
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Check if domain matches any allowed domain
-            if not any(allowed in domain for allowed in allowed_domains):
-                return False
-        except Exception:
+        domain = parsed.netloc.lower()
+
+        # Check if domain matches any allowed domain
+        if not any(allowed in domain for allowed in allowed_domains):
             return False
 
     return True
 
 
+def _parse_ip_host(hostname: str):
+    """
+    Parse a URL host as an IP address
+
+    Args:
+        hostname: Parsed hostname (brackets already removed for IPv6)
+
+    Returns:
+        IPv4Address/IPv6Address, or None if the host is a name
+    """
+    try:
+        return ipaddress.ip_address(hostname)
+    except ValueError:
+        pass
+
+    # Shorthand, hex and octal IPv4 forms (127.1, 0x7f.0.0.1, 2130706433)
+    # that resolvers and HTTP clients still accept
+    try:
+        return ipaddress.IPv4Address(socket.inet_aton(hostname))
+    except (OSError, ValueError):
+        return None
+
+
 def sanitize_header_value(value: str, max_length: int = 100) -> str:
     """
     Sanitize HTTP header value to prevent header injection.
@@ -192,12 +344,18 @@ def sanitize_header_value(value: str, max_length: int = 100) -> str:
     # Truncate to max length
     value = value[:max_length]
 
-    # Remove CRLF
-    value = value.replace('\r', '').replace('\n', '')
-    value = value.replace('%0d', '').replace('%0a', '')
-    value = value.replace('%0D', '').replace('%0A', '')
+    # Almost every real header value is clean; each check is a single
+    # memchr-speed scan and nothing is copied
+    if '%' not in value and '\r' not in value and '\n' not in value and '\x00' not in value:
+        return value.strip()
+
+    # Remove CRLF and null bytes in one pass
+    value = value.translate(_HEADER_DELETE_TABLE)
 
-    # Remove null bytes
-    value = value.replace('\x00', '').replace('%00', '')
+    # Remove percent-encoded CRLF and null bytes, repeating in case a
+    # removal joins a new one together (%%0d0a -> %0a)
+    removed = 1
+    while removed:
+        value, removed = _HEADER_PCT_RE.subn('', value)
 
     return value.strip()
@@ -7,34 +7,147 @@ Blocks:
 - Private IP ranges (10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16)
 - Cloud metadata endpoints (AWS, GCP, Azure)
 - Link-local addresses (169.254.0.0/16)
+- Shared, documentation, reserved and multicast ranges
 - DNS rebinding attacks
 - Non-HTTP(S) schemes
 - URLs with embedded credentials
 """
+import asyncio
 import ipaddress
 import socket
-from urllib.parse import urlparse
-from typing import Optional
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import ParseResult, urlparse
+from typing import Iterable, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for fetch_url, created on first use
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """
+    Get the process-wide requests.Session used by fetch_url
+
+    Reusing one session keeps connections alive between fetches, so
+    repeated requests to an API skip the TCP and TLS handshakes. Cookies
+    are never stored, so no state leaks from one fetch to the next.
+    """
+    global _http_session
+
+    if _http_session is None:
+        import requests
+
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _http_session = session
+
+    return _http_session
+
+
+# Every non-public block: the IANA special-purpose registries that the
+# ipaddress is_private/is_reserved/... properties classify, plus shared
+# address space (100.64.0.0/10, carrier-grade NAT) which they do not
+INTERNAL_NETWORKS = (
+    # IPv4
+    '0.0.0.0/8',          # "This network", unspecified
+    '10.0.0.0/8',         # RFC 1918
+    '100.64.0.0/10',      # Shared address space (CGNAT)
+    '127.0.0.0/8',        # Loopback
+    '169.254.0.0/16',     # Link-local, cloud metadata
+    '172.16.0.0/12',      # RFC 1918
+    '192.0.0.0/29',       # IETF protocol assignments
+    '192.0.0.170/31',     # NAT64/DNS64 discovery
+    '192.0.2.0/24',       # TEST-NET-1
+    '192.168.0.0/16',     # RFC 1918
+    '198.18.0.0/15',      # Benchmarking
+    '198.51.100.0/24',    # TEST-NET-2
+    '203.0.113.0/24',     # TEST-NET-3
+    '224.0.0.0/4',        # Multicast
+    '240.0.0.0/4',        # Reserved, limited broadcast
+    # IPv6
+    '::/8',               # Reserved: unspecified, loopback, IPv4-mapped
+    '100::/8',            # Reserved, discard-only
+    '200::/7',            # Reserved
+    '400::/6',            # Reserved
+    '800::/5',            # Reserved
+    '1000::/4',           # Reserved
+    '2001::/23',          # IETF protocol assignments
+    '2001:db8::/32',      # Documentation
+    '4000::/3',           # Reserved
+    '6000::/3',           # Reserved
+    '8000::/3',           # Reserved
+    'a000::/3',           # Reserved
+    'c000::/3',           # Reserved
+    'e000::/4',           # Reserved
+    'f000::/5',           # Reserved
+    'f800::/6',           # Reserved
+    'fc00::/7',           # Unique local
+    'fe00::/9',           # Reserved
+    'fe80::/10',          # Link-local
+    'ff00::/8',           # Multicast
+)
+
+
+def _compile_intervals(networks: Iterable[str], version: int) -> Tuple[List[int], List[int]]:
+    """
+    Merge networks of one IP version into sorted, disjoint integer ranges
+
+    Returns:
+        Parallel lists of range starts and inclusive range ends
+    """
+    ranges = sorted(
+        (int(net.network_address), int(net.broadcast_address))
+        for net in map(ipaddress.ip_network, networks)
+        if net.version == version
+    )
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in ranges:
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+_INTERNAL_INTERVALS = {
+    4: _compile_intervals(INTERNAL_NETWORKS, 4),
+    6: _compile_intervals(INTERNAL_NETWORKS, 6),
+}
+
+
+def is_internal_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """
+    Check whether an IP address must never be requested
+
+    Binary search over INTERNAL_NETWORKS compiled to merged integer
+    ranges, so the cost stays O(log N) as blocks are added instead of
+    testing membership in each network (as the ipaddress properties do).
+
+    Returns:
+        True for unspecified, loopback, private, shared, link-local,
+        documentation, reserved and multicast addresses
+    """
+    starts, ends = _INTERNAL_INTERVALS[ip.version]
+    value = int(ip)
+    i = bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
 
 class SSRFProtection:
     """SSRF protection with comprehensive IP and hostname validation"""
 
-    # Blocked private IP ranges (RFC 1918)
-    PRIVATE_IP_RANGES = [
-        ipaddress.ip_network('10.0.0.0/8'),         # Class A private
-        ipaddress.ip_network('172.16.0.0/12'),      # Class B private
-        ipaddress.ip_network('192.168.0.0/16'),     # Class C private
-        ipaddress.ip_network('127.0.0.0/8'),        # Loopback
-        ipaddress.ip_network('169.254.0.0/16'),     # Link-local
-        ipaddress.ip_network('::1/128'),            # IPv6 loopback
-        ipaddress.ip_network('fe80::/10'),          # IPv6 link-local
-        ipaddress.ip_network('fc00::/7'),           # IPv6 unique local
-    ]
-
     # Cloud metadata endpoints
     BLOCKED_HOSTNAMES = [
         'localhost',
@@ -46,6 +159,35 @@ class SSRFProtection:
     # Allowed URL schemes
     ALLOWED_SCHEMES = ['http', 'https']
 
+    # Resolution verdicts are reused briefly; the TTL bounds how long a
+    # DNS rebinding change can go unnoticed
+    DNS_CACHE_TTL_SECONDS = 30
+    DNS_CACHE_MAX_ENTRIES = 4096
+
+    # Scheme, credential and blocklist checks depend only on the URL
+    STATIC_CACHE_MAX_ENTRIES = 2048
+
+    def __init__(self):
+        """Initialize SSRF protection with empty verdict caches"""
+        # hostname -> (expiry on the monotonic clock, resolved IPs are safe)
+        self._dns_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._dns_lock = threading.Lock()
+
+        self._check_static = lru_cache(maxsize=self.STATIC_CACHE_MAX_ENTRIES)(
+            self._static_verdict
+        )
+
+    def clear_caches(self) -> None:
+        """
+        Drop all cached verdicts
+
+        Call after changing BLOCKED_HOSTNAMES or ALLOWED_SCHEMES on a
+        live instance.
+        """
+        self._check_static.cache_clear()
+        with self._dns_lock:
+            self._dns_cache.clear()
+
     def validate_url(self, url: str) -> bool:
         """
         Validate URL for SSRF safety
@@ -53,35 +195,103 @@ class SSRFProtection:
         Returns:
             True if URL is safe, False if blocked
         """
-        try:
-            parsed = urlparse(url)
-
-            # Check URL scheme
-            if parsed.scheme not in self.ALLOWED_SCHEMES:
-                logger.warning(f"Blocked URL with invalid scheme: {parsed.scheme}")
-                return False
+        return self.check_url(url) is not None
 
-            # Check for embedded credentials
-            if parsed.username or parsed.password:
-                logger.warning(f"Blocked URL with embedded credentials: {url}")
-                return False
+    def check_url(self, url: str) -> Optional[ParseResult]:
+        """
+        Validate URL for SSRF safety, keeping the parsed form
 
-            hostname = parsed.hostname or parsed.netloc
+        Returns:
+            The parsed URL if it is safe, None if blocked
+        """
+        try:
+            parsed, hostname, reason = self._check_static(url)
 
-            # Check hostname against blocklist
-            if not self.validate_hostname(hostname):
-                return False
+            if hostname is None:
+                if reason is not None:
+                    logger.warning(reason)
+                return None
 
             # Resolve hostname to IP and validate
             if not self._validate_resolved_ip(hostname):
+                return None
+
+            return parsed
+
+        except Exception as e:
+            logger.error(f"Error validating URL {url}: {e}")
+            return None
+
+    async def validate_url_async(self, url: str) -> bool:
+        """
+        Validate URL for SSRF safety without blocking the event loop
+
+        Same checks and caches as validate_url; only DNS resolution is
+        moved off the loop.
+
+        Returns:
+            True if URL is safe, False if blocked
+        """
+        try:
+            _, hostname, reason = self._check_static(url)
+
+            if hostname is None:
+                if reason is not None:
+                    logger.warning(reason)
                 return False
 
-            return True
+            # Resolve hostname to IP and validate
+            return await self._validate_resolved_ip_async(hostname)
 
         except Exception as e:
             logger.error(f"Error validating URL {url}: {e}")
             return False
 
+    async def validate_urls_async(self, urls: Iterable[str]) -> List[bool]:
+        """
+        Validate many URLs, resolving their hostnames concurrently
+
+        Returns:
+            One verdict per URL, in input order
+        """
+        return list(await asyncio.gather(*(self.validate_url_async(url) for url in urls)))
+
+    def _static_verdict(
+        self, url: str
+    ) -> Tuple[ParseResult, Optional[str], Optional[str]]:
+        """
+        Run the checks that need no DNS lookup (memoized per URL)
+
+        Returns:
+            (parsed URL, hostname to resolve, None) if the URL passes,
+            otherwise (parsed URL, None, reason to log) - the reason is
+            None when there is nothing worth logging
+
+        Raises:
+            ValueError: If the URL cannot be parsed
+        """
+        parsed = urlparse(url)
+
+        # Check URL scheme
+        if parsed.scheme not in self.ALLOWED_SCHEMES:
+            return parsed, None, f"Blocked URL with invalid scheme: {parsed.scheme}"
+
+        # Check for embedded credentials
+        if parsed.username or parsed.password:
+            return parsed, None, f"Blocked URL with embedded credentials: {url}"
+
+        hostname = parsed.hostname or parsed.netloc
+
+        # Check hostname against blocklist
+        if not hostname:
+            return parsed, None, None
+
+        reason = self._hostname_block_reason(hostname)
+        if reason is not None:
+            return parsed, None, reason
+
+        return parsed, hostname, None
+
     def validate_hostname(self, hostname: str) -> bool:
         """
         Validate hostname against blocklist
@@ -92,25 +302,37 @@ class SSRFProtection:
         if not hostname:
             return False
 
+        reason = self._hostname_block_reason(hostname)
+        if reason is not None:
+            logger.warning(reason)
+            return False
+
+        return True
+
+    def _hostname_block_reason(self, hostname: str) -> Optional[str]:
+        """
+        Check a non-empty hostname against the blocklist
+
+        Returns:
+            Reason the hostname is blocked, or None if it is allowed
+        """
         hostname_lower = hostname.lower()
 
         # Check against blocked hostnames
         for blocked in self.BLOCKED_HOSTNAMES:
             if hostname_lower == blocked or hostname_lower.endswith(f'.{blocked}'):
-                logger.warning(f"Blocked hostname: {hostname}")
-                return False
+                return f"Blocked hostname: {hostname}"
 
         # Check if hostname is an IP address
         try:
             ip = ipaddress.ip_address(hostname)
             if self._is_private_ip(ip):
-                logger.warning(f"Blocked private IP in hostname: {hostname}")
-                return False
+                return f"Blocked private IP in hostname: {hostname}"
         except ValueError:
             # Not an IP address, continue with DNS resolution
             pass
 
-        return True
+        return None
 
     def _is_unspecified_address(self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
         """
@@ -126,35 +348,112 @@ class SSRFProtection:
         Resolve hostname to IP and validate it's not private
         Prevents DNS rebinding attacks
 
+        Verdicts are cached per hostname for DNS_CACHE_TTL_SECONDS, so
+        repeated validation does not block on getaddrinfo every time.
+
         Returns:
             True if resolved IP is safe, False if blocked
         """
+        key = hostname.lower()
+        now = time.monotonic()
+
+        cached = self._cached_dns_verdict(key, now)
+        if cached is not None:
+            return cached
+
         try:
-            # Resolve hostname to IP addresses
             addr_info = socket.getaddrinfo(hostname, None)
+        except socket.gaierror as e:
+            # Not cached: resolution failures are often transient
+            logger.error(f"DNS resolution failed for {hostname}: {e}")
+            return False
 
-            for info in addr_info:
-                ip_str = info[4][0]
+        safe = self._check_resolved_ips(hostname, addr_info)
+        self._store_dns_verdict(key, now, safe)
+        return safe
 
-                try:
-                    ip = ipaddress.ip_address(ip_str)
+    async def _validate_resolved_ip_async(self, hostname: str) -> bool:
+        """
+        Non-blocking _validate_resolved_ip for use on the event loop
 
-                    if self._is_private_ip(ip):
-                        logger.warning(
-                            f"DNS rebinding attempt detected: {hostname} resolves to private IP {ip_str}"
-                        )
-                        return False
+        getaddrinfo runs in the loop's default executor. It returns every
+        A and AAAA record, which the all-addresses check relies on.
 
-                except ValueError:
-                    logger.error(f"Invalid IP address from DNS resolution: {ip_str}")
-                    return False
+        Returns:
+            True if resolved IP is safe, False if blocked
+        """
+        key = hostname.lower()
+        now = time.monotonic()
 
-            return True
+        cached = self._cached_dns_verdict(key, now)
+        if cached is not None:
+            return cached
 
+        loop = asyncio.get_running_loop()
+        try:
+            addr_info = await loop.run_in_executor(None, socket.getaddrinfo, hostname, None)
         except socket.gaierror as e:
+            # Not cached: resolution failures are often transient
             logger.error(f"DNS resolution failed for {hostname}: {e}")
             return False
 
+        safe = self._check_resolved_ips(hostname, addr_info)
+        self._store_dns_verdict(key, now, safe)
+        return safe
+
+    def _cached_dns_verdict(self, key: str, now: float) -> Optional[bool]:
+        """
+        Look up an unexpired DNS verdict
+
+        Returns:
+            Cached verdict, or None on a miss
+        """
+        with self._dns_lock:
+            cached = self._dns_cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._dns_cache.move_to_end(key)
+                    return cached[1]
+                del self._dns_cache[key]
+        return None
+
+    def _store_dns_verdict(self, key: str, now: float, safe: bool) -> None:
+        """Cache a DNS verdict, evicting the least recently used entry if full"""
+        with self._dns_lock:
+            self._dns_cache[key] = (now + self.DNS_CACHE_TTL_SECONDS, safe)
+            self._dns_cache.move_to_end(key)
+            if len(self._dns_cache) > self.DNS_CACHE_MAX_ENTRIES:
+                self._dns_cache.popitem(last=False)
+
+    def _check_resolved_ips(self, hostname: str, addr_info: list) -> bool:
+        """
+        Check every address a hostname resolved to
+
+        Args:
+            hostname: Hostname that was resolved (for logging)
+            addr_info: socket.getaddrinfo result
+
+        Returns:
+            True if all resolved IPs are safe, False if any is blocked
+        """
+        for info in addr_info:
+            ip_str = info[4][0]
+
+            try:
+                ip = ipaddress.ip_address(ip_str)
+
+                if self._is_private_ip(ip):
+                    logger.warning(
+                        f"DNS rebinding attempt detected: {hostname} resolves to private IP {ip_str}"
+                    )
+                    return False
+
+            except ValueError:
+                logger.error(f"Invalid IP address from DNS resolution: {ip_str}")
+                return False
+
+        return True
+
     def _is_private_ip(self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
         """
         Check if IP address is in private/blocked ranges
@@ -162,16 +461,7 @@ class SSRFProtection:
         Returns:
             True if IP is private/blocked, False if public
         """
-        # Check for unspecified addresses (0.0.0.0, ::)
-        if ip.is_unspecified:
-            return True
-
-        # Check against private ranges
-        for network in self.PRIVATE_IP_RANGES:
-            if ip in network:
-                return True
-
-        return False
+        return is_internal_ip(ip)
 
     def fetch_url(self, url: str, timeout: int = 10) -> Optional[str]:
         """
@@ -186,13 +476,14 @@ class SSRFProtection:
         """
         import requests
 
-        if not self.validate_url(url):
+        parsed = self.check_url(url)
+        if parsed is None:
             raise ValueError(f"URL blocked by SSRF protection: {url}")
 
         try:
             # Disable redirects to prevent redirect-based SSRF
-            response = requests.get(
-                url,
+            response = _get_http_session().get(
+                parsed.geturl(),
                 timeout=timeout,
                 allow_redirects=False,
                 verify=True
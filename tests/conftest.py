@@ -1,10 +1,22 @@
 """
 Pytest configuration and fixtures for DUCK-E tests
 """
+import asyncio
 import pytest
 import os
 from typing import Generator
 
+import redis.asyncio as redis
+
+# Optional uvloop import - libuv-backed event loop for the async tests
+# (installed with uvicorn[standard] on non-Windows platforms)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
@@ -15,6 +27,54 @@ def setup_test_environment():
     os.environ["COST_PROTECTION_ENABLED"] = "true"
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    One event loop for the whole test run
+
+    Session-scoped async resources (the Redis connection pool) hold
+    sockets bound to the loop they were opened on, so every test must
+    run on the same loop. Uses uvloop when installed, like the server.
+    """
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def redis_pool(event_loop):
+    """
+    Connection pool to a real Redis server, shared by the whole test run
+
+    Set REDIS_TEST_URL (e.g. redis://localhost:6379/15) to enable; tests
+    using it are skipped otherwise.
+    """
+    url = os.environ.get("REDIS_TEST_URL")
+    if not url:
+        pytest.skip("REDIS_TEST_URL not set")
+
+    pool = redis.ConnectionPool.from_url(url, decode_responses=True)
+    try:
+        event_loop.run_until_complete(redis.Redis(connection_pool=pool).ping())
+    except redis.ConnectionError as e:
+        event_loop.run_until_complete(pool.disconnect())
+        pytest.skip(f"Redis at {url} unavailable: {e}")
+
+    yield pool
+    event_loop.run_until_complete(pool.disconnect())
+
+
+@pytest.fixture(scope="session")
+def xdist_worker_id() -> str:
+    """
+    Name of the pytest-xdist worker running this test ("master" without -n)
+
+    Tests writing fixed keys to the shared Redis server include it, so
+    parallel workers don't overwrite each other's keys.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
 @pytest.fixture
 def clean_environment() -> Generator:
     """Clean up environment after each test"""
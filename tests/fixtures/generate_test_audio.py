@@ -13,6 +13,7 @@ Generates:
 
 import numpy as np
 import os
+from functools import lru_cache
 
 try:
     from scipy.io import wavfile
@@ -25,6 +26,16 @@ SAMPLE_RATE = 16000  # 16kHz - standard for voice
 FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+@lru_cache(maxsize=None)
+def _fade_windows(fade_len: int):
+    """Linear fade-in and fade-out ramps, built once per fade length."""
+    fade_in = np.linspace(0, 1, fade_len)
+    fade_out = np.linspace(1, 0, fade_len)
+    fade_in.setflags(write=False)
+    fade_out.setflags(write=False)
+    return fade_in, fade_out
+
+
 def generate_tone(frequency: float, duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
     """Generate a sine wave tone."""
     t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
@@ -40,19 +51,28 @@ def generate_silence(duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndar
 
 def generate_speech_like(duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
     """Generate audio that resembles speech patterns (varying tones)."""
-    samples = np.array([], dtype=np.int16)
-
     # Alternate between different frequencies to simulate speech
     frequencies = [200, 300, 250, 400, 350, 200]
     segment_duration = duration / len(frequencies)
-
-    for freq in frequencies:
-        segment = generate_tone(freq, segment_duration, sample_rate)
-        # Add slight fade in/out for natural sound
-        fade_len = min(100, len(segment) // 4)
-        segment[:fade_len] = (segment[:fade_len] * np.linspace(0, 1, fade_len)).astype(np.int16)
-        segment[-fade_len:] = (segment[-fade_len:] * np.linspace(1, 0, fade_len)).astype(np.int16)
-        samples = np.concatenate([samples, segment])
+    segment_len = int(sample_rate * segment_duration)
+
+    # All segments at once: one row per frequency, written straight into
+    # the output buffer instead of concatenating segment by segment
+    t = np.linspace(0, segment_duration, segment_len, dtype=np.float32)
+    omega = (2 * np.pi * np.asarray(frequencies, dtype=np.float64)).astype(np.float32)
+    samples = np.empty(len(frequencies) * segment_len, dtype=np.int16)
+    segments = samples.reshape(len(frequencies), segment_len)
+    phase = np.multiply.outer(omega, t)
+    np.sin(phase, out=phase)
+    phase *= 32767
+    segments[:] = phase
+
+    # Add slight fade in/out for natural sound
+    fade_len = min(100, segment_len // 4)
+    if fade_len:
+        fade_in, fade_out = _fade_windows(fade_len)
+        segments[:, :fade_len] = segments[:, :fade_len] * fade_in
+        segments[:, -fade_len:] = segments[:, -fade_len:] * fade_out
 
     return samples
 
@@ -8,12 +8,14 @@ Test Suite Structure:
 3. Test behavior through conversations between components
 4. Focus on HOW objects collaborate, not WHAT they contain
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock, call
 from fastapi import FastAPI, Request
-from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocket
+from httpx import ASGITransport, AsyncClient
 import time
+from types import MappingProxyType
 from typing import Dict, Any
 
 # Import the modules we're testing
@@ -26,6 +28,16 @@ from app.middleware.rate_limiting import (
     RateLimitConfig,
     check_redis_health
 )
+from tests.mocks.fast_redis import FastRedisMock
+from tests.mocks.collaborators import create_mock_redis_client, create_mock_request
+
+
+# Rate limit headers expected after a check (read-only, shared by tests)
+EXPECTED_RATE_LIMIT_HEADERS = MappingProxyType({
+    "X-RateLimit-Limit": "60",
+    "X-RateLimit-Remaining": "59",
+    "X-RateLimit-Reset": "1234567890"
+})
 
 
 class TestRateLimitingIntegration:
@@ -36,25 +48,13 @@ class TestRateLimitingIntegration:
 
     @pytest.fixture
     def mock_request(self) -> Mock:
-        """Create mock Request object for interaction testing"""
-        request = Mock(spec=Request)
-        request.client = Mock()
-        request.client.host = "192.168.1.100"
-        request.headers = {}
-        request.url = Mock()
-        request.url.path = "/status"
-        return request
+        """Create a fresh mock Request object for interaction testing"""
+        return create_mock_request()
 
     @pytest.fixture
     def mock_redis_client(self) -> AsyncMock:
-        """Create mock Redis client to verify Redis interactions"""
-        client = AsyncMock()
-        client.ping = AsyncMock(return_value=True)
-        client.get = AsyncMock(return_value=None)
-        client.setex = AsyncMock(return_value=True)
-        client.incr = AsyncMock(return_value=1)
-        client.expire = AsyncMock(return_value=True)
-        return client
+        """Create a fresh mock Redis client to verify Redis interactions"""
+        return create_mock_redis_client()
 
     @pytest.fixture
     def rate_limit_config(self) -> RateLimitConfig:
@@ -202,19 +202,26 @@ class TestRateLimitingIntegration:
         RED: Test that Redis correctly stores and retrieves rate limit state
 
         London School: Verify interaction contract between rate limiter and Redis
-        Expected: incr() called for counter, expire() called for TTL
+        Expected: incr() and expire() queued on one pipeline, sent in a
+        single round trip
         """
         # Arrange: Set up rate limit key
         client_ip = "192.168.1.100"
         rate_key = f"rate_limit:{client_ip}:/status"
 
         # Act: Simulate rate limit check
-        await mock_redis_client.incr(rate_key)
-        await mock_redis_client.expire(rate_key, 60)
+        async with mock_redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(rate_key)
+            pipe.expire(rate_key, 60)
+            await pipe.execute()
 
         # Assert: Verify Redis interactions
-        mock_redis_client.incr.assert_called_once_with(rate_key)
-        mock_redis_client.expire.assert_called_once_with(rate_key, 60)
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.incr.assert_called_once_with(rate_key)
+        pipe.expire.assert_called_once_with(rate_key, 60)
+        pipe.execute.assert_awaited_once()
+        mock_redis_client.incr.assert_not_called()
+        mock_redis_client.expire.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_graceful_degradation_when_redis_down(self, mock_redis_client):
@@ -262,46 +269,43 @@ class TestRateLimitingIntegration:
         mock_response = Mock()
         mock_response.headers = {}
 
-        # Expected headers after rate limit check
-        expected_headers = {
-            "X-RateLimit-Limit": "60",
-            "X-RateLimit-Remaining": "59",
-            "X-RateLimit-Reset": "1234567890"
-        }
-
         # Simulate adding headers
-        for key, value in expected_headers.items():
-            mock_response.headers[key] = value
+        mock_response.headers.update(EXPECTED_RATE_LIMIT_HEADERS)
 
         # Verify headers were set
         assert "X-RateLimit-Limit" in mock_response.headers
         assert "X-RateLimit-Remaining" in mock_response.headers
         assert "X-RateLimit-Reset" in mock_response.headers
 
-    def test_performance_overhead_under_10ms(self):
+    def test_performance_overhead_under_10ms(self, monkeypatch):
         """
         RED: Test that rate limiting adds < 10ms overhead
 
         London School: Verify performance contract through timing
         """
+        # Deterministic clock: only advances when the limiter does work
+        now = [0.0]
+        monkeypatch.setattr(time, "perf_counter", lambda: now[0])
+
         # Mock limiter check operation
         mock_limiter = Mock()
 
         def fast_check():
             # Simulate minimal processing
-            time.sleep(0.001)  # 1ms
+            now[0] += 0.002  # 2ms
             return True
 
         mock_limiter.check = Mock(side_effect=fast_check)
 
         # Measure overhead
-        start_time = time.time()
+        start_time = time.perf_counter()
         mock_limiter.check()
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         overhead_ms = (end_time - start_time) * 1000
 
-        # Assert: Overhead should be under 10ms
+        # Assert: Overhead should be exactly the simulated work, under 10ms
+        assert overhead_ms == pytest.approx(2.0)
         assert overhead_ms < 10, f"Rate limiting overhead {overhead_ms:.2f}ms exceeds 10ms limit"
 
     def test_rate_limit_config_loads_from_environment(self, monkeypatch):
@@ -324,29 +328,24 @@ class TestRateLimitingIntegration:
         assert config.redis_url == "redis://test:6379"
 
     @pytest.mark.asyncio
-    async def test_concurrent_requests_maintain_accurate_count(self, mock_redis_client):
+    async def test_concurrent_requests_maintain_accurate_count(self):
         """
         RED: Test that concurrent requests maintain accurate rate limit count
 
         London School: Test thread-safety through concurrent interactions
         """
-        # Mock atomic increment
-        call_count = {'value': 0}
-
-        async def atomic_incr(key):
-            call_count['value'] += 1
-            return call_count['value']
-
-        mock_redis_client.incr = AsyncMock(side_effect=atomic_incr)
+        # Stub with an atomic counter; no per-call mock bookkeeping
+        redis_client = FastRedisMock()
 
         # Simulate 10 concurrent requests
-        import asyncio
-        tasks = [mock_redis_client.incr("test_key") for _ in range(10)]
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(redis_client.incr("test_key")) for _ in range(10)]
+        results = [task.result() for task in tasks]
 
-        # Verify all increments were counted
-        assert call_count['value'] == 10
-        assert mock_redis_client.incr.call_count == 10
+        # Verify all increments were counted, each seeing a distinct count
+        assert redis_client.counter == 10
+        assert sorted(results) == list(range(1, 11))
+        assert redis_client.calls == [("incr", "test_key")] * 10
 
 
 class TestRateLimitingEndpointIntegration:
@@ -376,40 +375,41 @@ class TestRateLimitingEndpointIntegration:
 
         return app
 
-    def test_fastapi_integration_status_endpoint(self, test_app):
+    @pytest.mark.asyncio
+    async def test_fastapi_integration_status_endpoint(self, test_app):
         """
         RED: Test rate limiting integration with /status endpoint
 
         This test will FAIL until we add @limiter.limit decorator in main.py
         """
-        client = TestClient(test_app)
+        async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+            # Make 60 concurrent requests - should succeed
+            responses = await asyncio.gather(*[client.get("/status") for _ in range(60)])
+            for i, response in enumerate(responses):
+                assert response.status_code == 200, f"Request {i+1} failed unexpectedly"
 
-        # Make 60 requests - should succeed
-        for i in range(60):
-            response = client.get("/status")
-            assert response.status_code == 200, f"Request {i+1} failed unexpectedly"
+            # 61st request should fail with 429
+            response = await client.get("/status")
 
-        # 61st request should fail with 429
-        response = client.get("/status")
         # This will FAIL in RED phase - no rate limiting applied yet
         assert response.status_code == 429, "Expected rate limit exceeded (429)"
         assert "rate limit" in response.json().get("detail", {}).get("error", "").lower()
 
-    def test_fastapi_integration_main_page(self, test_app):
+    @pytest.mark.asyncio
+    async def test_fastapi_integration_main_page(self, test_app):
         """
         RED: Test rate limiting integration with / endpoint
 
         This test will FAIL until we integrate rate limiting
         """
-        client = TestClient(test_app)
+        async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+            # Make 30 concurrent requests - should succeed
+            responses = await asyncio.gather(*[client.get("/") for _ in range(30)])
+            assert all(response.status_code == 200 for response in responses)
 
-        # Make 30 requests - should succeed
-        for i in range(30):
-            response = client.get("/")
-            assert response.status_code == 200
+            # 31st request should fail
+            response = await client.get("/")
 
-        # 31st request should fail
-        response = client.get("/")
         # This will FAIL in RED phase
         assert response.status_code == 429
 
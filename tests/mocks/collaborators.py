@@ -0,0 +1,66 @@
+"""
+Mock FastAPI requests and Redis clients for DUCK-E tests.
+
+Each call builds a fresh mock. Mocks are not pooled between tests:
+reset_mock() does not clear plain assigned attributes (request.state.user_tier,
+a replaced client.incr), so a reused mock would carry one test's state
+into the next.
+
+Usage:
+    from tests.mocks.collaborators import create_mock_request
+
+    @pytest.fixture
+    def mock_request():
+        return create_mock_request()
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from fastapi import Request
+
+
+DEFAULT_CLIENT_HOST = "192.168.1.100"
+DEFAULT_PATH = "/status"
+
+# Default return values of the mock Redis client's commands
+REDIS_RETURN_VALUES = {
+    "ping": True,
+    "get": None,
+    "setex": True,
+    "incr": 1,
+    "expire": True,
+}
+
+
+def create_mock_request() -> Mock:
+    """
+    Create a mock FastAPI Request
+
+    Returns:
+        Mock(spec=Request) with client.host, headers and url.path set
+    """
+    request = Mock(spec=Request)
+    request.headers = {}
+    request.client = Mock(host=DEFAULT_CLIENT_HOST)
+    request.url = Mock(path=DEFAULT_PATH)
+    return request
+
+
+def create_mock_redis_client() -> AsyncMock:
+    """
+    Create a mock async Redis client
+
+    Returns:
+        AsyncMock whose commands return REDIS_RETURN_VALUES, with a
+        pipeline() usable as an async context manager
+    """
+    client = AsyncMock()
+    for command, value in REDIS_RETURN_VALUES.items():
+        setattr(client, command, AsyncMock(return_value=value))
+
+    # Like redis.asyncio: commands queue synchronously, execute() is awaited
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipeline
+    pipeline.execute = AsyncMock(return_value=[])
+    client.pipeline = MagicMock(return_value=pipeline)
+    return client
@@ -0,0 +1,49 @@
+"""
+Hand-written async Redis stub for DUCK-E tests.
+
+AsyncMock records call args, await state and child mocks on every call;
+for tests that drive many commands and only check counts, this stub
+keeps a plain counter and a list of (command, *args) tuples instead.
+
+Usage:
+    from tests.mocks.fast_redis import FastRedisMock
+
+    client = FastRedisMock()
+    await client.incr("rate_limit:1.2.3.4:/status")
+    assert ("incr", "rate_limit:1.2.3.4:/status") in client.calls
+"""
+
+from typing import Any, List, Tuple
+
+
+class FastRedisMock:
+    """
+    Async Redis client stub with a single shared INCR counter
+
+    Attributes:
+        counter: Value returned by the last incr(), whatever the key
+        calls: (command, *args) tuple per command, in call order
+        health_ok: When False, ping() raises ConnectionError
+    """
+
+    __slots__ = ("counter", "calls", "health_ok")
+
+    def __init__(self):
+        self.counter = 0
+        self.calls: List[Tuple[Any, ...]] = []
+        self.health_ok = True
+
+    async def incr(self, key: str) -> int:
+        self.calls.append(("incr", key))
+        self.counter += 1
+        return self.counter
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        self.calls.append(("expire", key, ttl))
+        return True
+
+    async def ping(self) -> bool:
+        self.calls.append(("ping",))
+        if not self.health_ok:
+            raise ConnectionError("down")
+        return True
@@ -5,8 +5,10 @@ Usage:
     from tests.mocks.openai_mock import create_mock_response, MockRealtimeStream
 """
 
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import json
 
 
@@ -15,10 +17,13 @@ def create_mock_response(
     has_tool_calls: bool = False,
     tool_call_name: str = "web_search",
     finish_reason: str = "stop"
-) -> MagicMock:
+) -> SimpleNamespace:
     """
     Create a mock OpenAI chat completion response.
 
+    Plain data objects rather than MagicMocks: responses are only read,
+    never asserted on, and a missing attribute should fail loudly.
+
     Args:
         content: The response content text
         has_tool_calls: Whether to include tool_calls in response
@@ -26,65 +31,57 @@ def create_mock_response(
         finish_reason: The finish reason (stop, tool_calls, length, etc.)
 
     Returns:
-        MagicMock configured like openai.chat.completions.create() response
+        Object shaped like an openai.chat.completions.create() response
     """
-    message = MagicMock()
-    message.content = content
-
+    tool_calls = None
     if has_tool_calls:
-        tool_call = MagicMock()
-        tool_call.id = "call_abc123"
-        tool_call.type = "function"
-        tool_call.function = MagicMock()
-        tool_call.function.name = tool_call_name
-        tool_call.function.arguments = json.dumps({"query": "test query"})
-        message.tool_calls = [tool_call]
+        tool_calls = [SimpleNamespace(
+            id="call_abc123",
+            type="function",
+            function=SimpleNamespace(
+                name=tool_call_name,
+                arguments=json.dumps({"query": "test query"})
+            )
+        )]
         finish_reason = "tool_calls"
-    else:
-        message.tool_calls = None
 
-    choice = MagicMock()
-    choice.message = message
-    choice.finish_reason = finish_reason
-    choice.index = 0
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    choice = SimpleNamespace(message=message, finish_reason=finish_reason, index=0)
 
-    response = MagicMock()
-    response.choices = [choice]
-    response.id = "chatcmpl-abc123"
-    response.model = "gpt-5-mini"
-    response.usage = MagicMock(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+    return SimpleNamespace(
+        choices=[choice],
+        id="chatcmpl-abc123",
+        model="gpt-5-mini",
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+    )
 
-    return response
 
-
-def create_mock_empty_response() -> MagicMock:
+def create_mock_empty_response() -> SimpleNamespace:
     """Create a mock response with no choices."""
-    response = MagicMock()
-    response.choices = []
-    return response
+    return SimpleNamespace(choices=[])
 
 
-def create_mock_streaming_response(chunks: List[str]) -> List[MagicMock]:
+def create_mock_streaming_response(chunks: List[str]) -> Iterator[SimpleNamespace]:
     """
-    Create a list of mock streaming response chunks.
+    Lazily yield mock streaming response chunks.
+
+    Chunks are built as the stream is consumed, like the real
+    stream=True iterator; wrap in list() to index or replay them.
 
     Args:
         chunks: List of text chunks to simulate streaming
 
-    Returns:
-        List of MagicMock objects simulating streaming chunks
+    Yields:
+        Objects shaped like streaming chunks
     """
-    mock_chunks = []
+    last = len(chunks) - 1
 
     for i, chunk_text in enumerate(chunks):
-        chunk = MagicMock()
-        chunk.choices = [MagicMock()]
-        chunk.choices[0].delta = MagicMock()
-        chunk.choices[0].delta.content = chunk_text
-        chunk.choices[0].finish_reason = None if i < len(chunks) - 1 else "stop"
-        mock_chunks.append(chunk)
-
-    return mock_chunks
+        yield SimpleNamespace(choices=[SimpleNamespace(
+            delta=SimpleNamespace(content=chunk_text),
+            finish_reason=None if i < last else "stop",
+            index=0
+        )])
 
 
 class MockRealtimeStream:
@@ -102,24 +99,18 @@ class MockRealtimeStream:
             print(message)
     """
 
+    __slots__ = ("messages",)
+
     def __init__(self, messages: List[Dict[str, Any]]):
         self.messages = messages
-        self._index = 0
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        if self._index >= len(self.messages):
-            raise StopAsyncIteration
 
-        message = self.messages[self._index]
-        self._index += 1
-        return message
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
 
 
 def create_mock_openai_client(
-    chat_response: Optional[MagicMock] = None,
+    chat_response: Optional[Any] = None,
     raise_exception: Optional[Exception] = None
 ) -> MagicMock:
     """
@@ -130,7 +121,8 @@ def create_mock_openai_client(
         raise_exception: Exception to raise instead of returning response
 
     Returns:
-        MagicMock configured like openai.OpenAI()
+        MagicMock configured like openai.OpenAI(), so calls can be asserted
+        (client.chat.completions.create.assert_called_once())
     """
     client = MagicMock()
 
@@ -144,6 +136,51 @@ def create_mock_openai_client(
     return client
 
 
+# Error instances are built once per run and shared; tests only raise
+# them and match on type
+@lru_cache(maxsize=None)
+def _rate_limit_error():
+    from openai import RateLimitError
+    return RateLimitError("Rate limit exceeded", response=MagicMock(), body=None)
+
+
+@lru_cache(maxsize=None)
+def _timeout_error():
+    from openai import APITimeoutError
+    return APITimeoutError(request=MagicMock())
+
+
+@lru_cache(maxsize=None)
+def _connection_error():
+    from openai import APIConnectionError
+    return APIConnectionError(request=MagicMock())
+
+
+@lru_cache(maxsize=None)
+def _auth_error():
+    from openai import AuthenticationError
+    return AuthenticationError(
+        "Invalid API key",
+        response=MagicMock(status_code=401),
+        body=None
+    )
+
+
+_ERROR_BUILDERS = {
+    "rate_limit": _rate_limit_error,
+    "timeout": _timeout_error,
+    "connection_error": _connection_error,
+    "auth_error": _auth_error,
+}
+
+
+def _shared(error: Exception) -> Exception:
+    """Strip state left by an earlier raise so tests don't see each other's frames"""
+    error.__context__ = None
+    error.__cause__ = None
+    return error.with_traceback(None)
+
+
 # Common error scenarios
 class MockOpenAIErrors:
     """Factory for common OpenAI error scenarios."""
@@ -151,27 +188,32 @@ class MockOpenAIErrors:
     @staticmethod
     def rate_limit():
         """Simulate rate limit error."""
-        from openai import RateLimitError
-        return RateLimitError("Rate limit exceeded", response=MagicMock(), body=None)
+        return _shared(_rate_limit_error())
 
     @staticmethod
     def timeout():
         """Simulate timeout error."""
-        from openai import APITimeoutError
-        return APITimeoutError(request=MagicMock())
+        return _shared(_timeout_error())
 
     @staticmethod
     def connection_error():
         """Simulate connection error."""
-        from openai import APIConnectionError
-        return APIConnectionError(request=MagicMock())
+        return _shared(_connection_error())
 
     @staticmethod
     def auth_error():
         """Simulate authentication error."""
-        from openai import AuthenticationError
-        return AuthenticationError(
-            "Invalid API key",
-            response=MagicMock(status_code=401),
-            body=None
-        )
+        return _shared(_auth_error())
+
+    @staticmethod
+    def fresh(kind: str) -> Exception:
+        """
+        Build a new, unshared error instance.
+
+        Args:
+            kind: Factory name (rate_limit, timeout, connection_error, auth_error)
+
+        Returns:
+            Newly constructed exception, for tests that mutate it
+        """
+        return _ERROR_BUILDERS[kind].__wrapped__()
@@ -4,13 +4,64 @@ Pytest configuration and fixtures for authentication tests
 import pytest
 from datetime import datetime, timedelta, timezone
 from jose import jwt
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 # Test JWT configuration
 TEST_SECRET_KEY = "test-secret-key-for-jwt-validation-only"  # pragma: allowlist secret
 TEST_ALGORITHM = "HS256"
 
+# Fixed expiries for the session-scoped tokens, so each is encoded once
+# per run and stays valid (or expired) however long the run takes
+FAR_FUTURE_EXP = datetime(2099, 1, 1, tzinfo=timezone.utc)
+PAST_EXP = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_test_token(payload: Dict[str, Any], secret: str = TEST_SECRET_KEY) -> str:
+    """Encode a test JWT token with the test algorithm"""
+    return jwt.encode(payload, secret, algorithm=TEST_ALGORITHM)
+
+
+# The fixed tokens are signed while this conftest is loaded, before
+# the first test runs, and handed out by the session fixtures below
+VALID_PREMIUM_TOKEN = encode_test_token({
+    "sub": "test_premium_user",
+    "tier": "premium",
+    "exp": FAR_FUTURE_EXP
+})
+VALID_ENTERPRISE_TOKEN = encode_test_token({
+    "sub": "test_enterprise_user",
+    "tier": "enterprise",
+    "exp": FAR_FUTURE_EXP
+})
+EXPIRED_TOKEN = encode_test_token({
+    "sub": "expired_user",
+    "tier": "premium",
+    "exp": PAST_EXP
+})
+INVALID_SIGNATURE_TOKEN = encode_test_token({
+    "sub": "attacker",
+    "tier": "enterprise",
+    "exp": FAR_FUTURE_EXP
+}, "wrong-secret-key")  # pragma: allowlist secret
+
+
+# Tokens built by create_test_token, keyed on (frozen payload, secret);
+# shared across tests so a payload repeated by parametrized cases is
+# signed once per run
+_token_cache: Dict[Tuple[Any, str], str] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a JWT claim value"""
+    if isinstance(value, datetime):
+        return (datetime, value.isoformat())
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 @pytest.fixture
 def jwt_secret():
@@ -33,54 +84,37 @@ def create_test_token():
         if "exp" not in payload:
             payload["exp"] = datetime.now(timezone.utc) + timedelta(hours=2)
 
-        return jwt.encode(payload, secret, algorithm=TEST_ALGORITHM)
+        key = (_freeze(payload), secret)
+        token = _token_cache.get(key)
+        if token is None:
+            token = _token_cache[key] = encode_test_token(payload, secret)
+        return token
 
     return _create_token
 
 
-@pytest.fixture
-def valid_premium_token(create_test_token):
+@pytest.fixture(scope="session")
+def valid_premium_token():
     """Valid premium tier JWT token"""
-    payload = {
-        "sub": "test_premium_user",
-        "tier": "premium",
-        "exp": datetime.now(timezone.utc) + timedelta(hours=2)
-    }
-    return create_test_token(payload)
+    return VALID_PREMIUM_TOKEN
 
 
-@pytest.fixture
-def valid_enterprise_token(create_test_token):
+@pytest.fixture(scope="session")
+def valid_enterprise_token():
     """Valid enterprise tier JWT token"""
-    payload = {
-        "sub": "test_enterprise_user",
-        "tier": "enterprise",
-        "exp": datetime.now(timezone.utc) + timedelta(hours=8)
-    }
-    return create_test_token(payload)
+    return VALID_ENTERPRISE_TOKEN
 
 
-@pytest.fixture
-def expired_token(create_test_token):
+@pytest.fixture(scope="session")
+def expired_token():
     """Expired JWT token"""
-    payload = {
-        "sub": "expired_user",
-        "tier": "premium",
-        "exp": datetime.now(timezone.utc) - timedelta(hours=1)
-    }
-    return create_test_token(payload)
+    return EXPIRED_TOKEN
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token_with_invalid_signature():
     """Token with invalid signature (signed with wrong key)"""
-    payload = {
-        "sub": "attacker",
-        "tier": "enterprise",
-        "exp": datetime.now(timezone.utc) + timedelta(hours=1)
-    }
-    wrong_secret = "wrong-secret-key"  # pragma: allowlist secret
-    return jwt.encode(payload, wrong_secret, algorithm=TEST_ALGORITHM)
+    return INVALID_SIGNATURE_TOKEN
 
 
 @pytest.fixture
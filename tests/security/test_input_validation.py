@@ -198,6 +198,62 @@ class TestLocationValidation:
                 LocationInput(location=attempt)
             assert "Invalid location format" in str(exc_info.value) or "validation error" in str(exc_info.value).lower()
 
+    def test_plain_ascii_fast_path_still_blocks_keywords(self):
+        """Plain ASCII input skips the full gauntlet but not word-level checks"""
+        from app.models.validators import LocationInput
+
+        keyword_attempts = [
+            "Paris union select",
+            "DROP table cities",
+            "localhost",
+            "Internal Services",
+            "Berlin -- comment",
+            "London..Paris",
+        ]
+
+        for attempt in keyword_attempts:
+            with pytest.raises(ValidationError) as exc_info:
+                LocationInput(location=attempt)
+            assert "Invalid location format" in str(exc_info.value)
+
+        assert LocationInput(location="Stratford-upon-Avon, UK").location == "Stratford-upon-Avon, UK"
+
+    def test_unicode_fast_path_matches_full_checks(self):
+        """Names without forbidden characters keep the full gauntlet's verdicts"""
+        from app.models.validators import LocationInput
+
+        rejected = {
+            "Zürich 10.0.0.1": "IP addresses",
+            "Zürich x127.0.0.1": "internal hostnames",
+            "São Paulo ſelect": "SQL-like syntax",
+            "Zürich..Genève": "path traversal",
+            "Zürich!Genève": "only letters",
+            "Zürich; rm": "SQL-like syntax",
+        }
+
+        for attempt, reason in rejected.items():
+            with pytest.raises(ValidationError) as exc_info:
+                LocationInput(location=attempt)
+            assert reason in str(exc_info.value)
+
+        assert LocationInput(location="São Paulo, Brasil").location == "São Paulo, Brasil"
+
+    def test_repeat_inputs_served_from_cache(self):
+        """Repeated values, accepted or rejected, should hit the validator cache"""
+        from app.models.validators import LocationInput, _validate_location
+
+        _validate_location.cache_clear()
+
+        for _ in range(3):
+            assert LocationInput(location="  Tokyo ").location == "Tokyo"
+            with pytest.raises(ValidationError) as exc_info:
+                LocationInput(location="Paris; rm -rf /")
+            assert "Invalid location format" in str(exc_info.value)
+
+        info = _validate_location.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+
 
 class TestSearchQueryValidation:
     """Test search query validation"""
@@ -354,6 +410,28 @@ class TestAcceptLanguageValidation:
                 AcceptLanguage(language=payload)
             assert "Invalid language code" in str(exc_info.value) or "validation error" in str(exc_info.value).lower()
 
+    def test_plain_function_matches_model(self):
+        """The model-free validator should accept and reject the same headers"""
+        from app.models.validators import AcceptLanguage, validate_accept_language
+
+        assert validate_accept_language(" en-US,en;q=0.9 ") == AcceptLanguage(language=" en-US,en;q=0.9 ").language
+
+        for payload in ["en-US\r\nX-Evil: 1", "en| whoami", "en-US" + ",fr-FR" * 20, ""]:
+            with pytest.raises(ValueError):
+                validate_accept_language(payload)
+            with pytest.raises(ValidationError):
+                AcceptLanguage(language=payload)
+
+    def test_header_value_sanitizer_strips_raw_and_encoded_crlf(self):
+        """Header sanitization removes CR/LF/NUL, including encodings revealed by removal"""
+        from app.security.sanitizers import sanitize_header_value
+
+        assert sanitize_header_value(" en-US,en;q=0.9 ") == "en-US,en;q=0.9"
+        assert sanitize_header_value("en\r\nX-Evil: 1") == "enX-Evil: 1"
+        assert sanitize_header_value("en%0D%0aX-Evil%00") == "enX-Evil"
+        assert sanitize_header_value("en%%0d0AX-Evil") == "enX-Evil"
+        assert sanitize_header_value("a" * 150, max_length=100) == "a" * 100
+
 
 class TestURLParameterEncoding:
     """Test that URL parameters are properly encoded and validated"""
@@ -392,6 +470,47 @@ class TestURLParameterEncoding:
             assert "?admin=" not in sanitized
             assert "#/" not in sanitized
 
+    def test_unreserved_parameters_match_quote_plus(self):
+        """Values that need no encoding skip quoting but match quote_plus"""
+        from urllib.parse import quote_plus
+        from app.security.sanitizers import sanitize_url_parameter
+
+        values = [
+            "London", "sess_3f9a-8b7c.6d~5e", "New York", "a+b", "50%",
+            "Zürich", "../etc", "line\n", "en-US",
+        ]
+        for value in values:
+            assert sanitize_url_parameter(value) == quote_plus(value, safe=''), value
+
+    def test_validate_url_safe_checks_scheme_and_host(self):
+        """Dangerous schemes and internal hosts are blocked by the parsed URL"""
+        from app.security.sanitizers import validate_url_safe
+
+        blocked = [
+            "file:///etc/passwd",
+            " \x00FILE:///etc/passwd",
+            "fi\tle:///etc/passwd",
+            "data:text/html,<script>alert(1)</script>",
+            "http://localhost:8000/admin",
+            "http://api.localhost/",
+            "http://[::1]/",
+            "http://user@10.0.0.1/",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://172.20.0.1/",
+            "http://127.1/",
+            "http://0x7f.0.0.1/",
+            "http://2130706433/",
+            "http://[::ffff:127.0.0.1]/",
+            "http://metadata.google.internal/",
+        ]
+        for url in blocked:
+            assert not validate_url_safe(url), url
+
+        # Internal-looking text outside the scheme and host is fine
+        assert validate_url_safe("https://10.example.com/")
+        assert validate_url_safe("https://example.com/docs/file://notes")
+        assert validate_url_safe("https://8.8.8.8/")
+
 
 class TestAPIResponseSanitization:
     """Test that API responses are sanitized before use"""
@@ -434,6 +553,182 @@ class TestAPIResponseSanitization:
         # Should remove dangerous HTML
         assert "onerror=" not in str(sanitized)
 
+    def test_removal_exposing_new_pattern_still_sanitized(self):
+        """Patterns revealed by an earlier removal should still be stripped"""
+        from app.security.sanitizers import sanitize_api_response
+
+        sanitized = sanitize_api_response({
+            "link": "javas<script>x</script>cript:alert(1)",
+            "plain": "Sunny & 25°C",
+        })
+
+        assert "javascript:" not in sanitized["link"]
+        assert sanitized["plain"] == "Sunny &amp; 25°C"
+
+    def test_long_response_strings_sanitized(self):
+        """Long strings (scanned by the linear-time engine when installed) are sanitized"""
+        from app.security.sanitizers import sanitize_api_response
+
+        padding = "Partly cloudy with light winds. " * 20
+        sanitized = sanitize_api_response({
+            "forecast": padding + "<script>alert(1)</script><img src=x onerror=alert(1)>",
+            "padding": " " * 5000 + "onload",
+        })
+
+        assert "<script>" not in sanitized["forecast"]
+        assert "alert(1)</script>" not in sanitized["forecast"]
+        assert "onerror=" not in sanitized["forecast"]
+        assert sanitized["forecast"].startswith(padding)
+        assert sanitized["padding"] == " " * 5000 + "onload"
+
+    def test_crafted_strings_sanitized_in_linear_time_without_re2(self, monkeypatch):
+        """16 KB backtracking bait stays fast on the re fallback"""
+        import importlib
+        import time
+        from app.security import regex_compat, sanitizers
+
+        monkeypatch.setattr(regex_compat, "RE2_AVAILABLE", False)
+        fallback = importlib.reload(sanitizers)
+        try:
+            assert not fallback.RE2_AVAILABLE
+            crafted = [
+                "on" * 8000 + "=",
+                "on" * 4000 + " " * 8000,
+                "<script>" * 2000,
+                "</script>" + "<script>" * 2000,
+                "<object>" * 2000 + "</embed>",
+            ]
+
+            start = time.perf_counter()
+            for value in crafted:
+                fallback.sanitize_api_response(value)
+            elapsed = time.perf_counter() - start
+
+            # Each took 0.3-4.7 s with the unbounded patterns on re
+            assert elapsed < 0.5
+            assert fallback.sanitize_api_response(
+                "<p onclick='x()'>hi</p><script>a</script>"
+            ) == "&lt;p&gt;hi&lt;/p&gt;"
+        finally:
+            monkeypatch.undo()
+            importlib.reload(sanitizers)
+
+    def test_deeply_nested_response_sanitized_without_recursion(self):
+        """Deeply nested payloads are sanitized iteratively and the input is left untouched"""
+        from app.security.sanitizers import sanitize_api_response
+
+        response = {"items": []}
+        level = response["items"]
+        for _ in range(5000):
+            child = {"note": "<script>x</script>ok", "items": []}
+            level.append(child)
+            level = child["items"]
+
+        sanitized = sanitize_api_response(response)
+
+        level = sanitized["items"]
+        for _ in range(5000):
+            assert level[0]["note"] == "ok"
+            level = level[0]["items"]
+        assert response["items"][0]["note"] == "<script>x</script>ok"
+
+    def test_clean_strings_returned_unchanged(self):
+        """Strings with nothing to strip or escape are passed through as-is"""
+        from app.security.sanitizers import sanitize_api_response
+
+        clean = "Partly cloudy, 18°C in São Paulo"
+        assert sanitize_api_response(clean) is clean
+        assert sanitize_api_response("Sun > rain") == "Sun &gt; rain"
+
+    def test_repeated_short_values_share_one_object(self):
+        """Short sanitized values are interned; long ones are left alone"""
+        import json
+        from app.security.sanitizers import sanitize_api_response
+
+        hours = json.loads(json.dumps([
+            {"condition": "Clear", "wind": "N<E", "summary": "Clear " * 20},
+            {"condition": "Clear", "wind": "N<E", "summary": "Clear " * 20},
+        ]))
+        assert hours[0]["condition"] is not hours[1]["condition"]
+
+        first, second = sanitize_api_response(hours)
+        assert first["condition"] is second["condition"]
+        assert first["wind"] is second["wind"] == "N&lt;E"
+        assert first["summary"] == second["summary"]
+        assert first["summary"] is hours[0]["summary"]
+
+
+class TestLinearTimeRegex:
+    """Test the RE2 translation used for patterns run over untrusted text"""
+
+    def test_unicode_classes_widened_for_re2(self):
+        """\\s, \\w and \\d are rewritten to Unicode classes, in and out of brackets"""
+        from app.security.regex_compat import to_re2_pattern
+
+        assert to_re2_pattern(r'\w+') == r'[\p{L}\p{N}_]+'
+        assert to_re2_pattern(r'[\w-]') == r'[\p{L}\p{N}_-]'
+        assert to_re2_pattern(r'\D') == r'[^\p{Nd}]'
+        assert to_re2_pattern(r'\bkey\b') == r'\bkey\b'
+
+        with pytest.raises(ValueError):
+            to_re2_pattern(r'[\S]')
+
+    def test_compile_linear_uses_re2_when_installed(self):
+        """With google-re2 installed, patterns compile to RE2 and match like re"""
+        pytest.importorskip("re2")
+        import re
+        from app.security.regex_compat import compile_linear
+
+        pattern = r'(?i)(api[_-]?key|apikey|key)[\s:=]+[\w-]+'
+        rx = compile_linear(pattern)
+
+        assert type(rx).__module__ == "re2"
+        for text in ("API_KEY=abc-123", "key:\u00a0ключ-1", "no secrets here"):
+            expected = re.search(pattern, text)
+            found = rx.search(text)
+            assert (found and found.group(0)) == (expected and expected.group(0))
+
+    def test_compile_linear_falls_back_for_unsupported_patterns(self):
+        """Patterns RE2 cannot express (backreferences) still compile with re"""
+        import re
+        from app.security.regex_compat import compile_linear
+
+        rx = compile_linear(r'(ab)\1')
+
+        assert isinstance(rx, re.Pattern)
+        assert rx.search("xababx")
+
+
+class TestLiteralScanner:
+    """Test that both LiteralScanner paths find the same validator tokens"""
+
+    @pytest.mark.parametrize("table", ["_LOCATION_LITERALS", "_QUERY_LITERALS", "_LANGUAGE_LITERALS"])
+    def test_automaton_and_fallback_agree(self, table):
+        """The Aho-Corasick automaton and the substring fallback report the same categories"""
+        pytest.importorskip("ahocorasick")
+        import copy
+        from app.models import validators
+
+        scanner = getattr(validators, table)
+        assert scanner._automaton is not None
+
+        fallback = copy.copy(scanner)
+        fallback._automaton = None
+
+        tokens = list(scanner._tokens)
+        samples = ["", "new york", "zürich", "x" * 500]
+        samples += [f"a{token}b" for token in tokens]
+        samples += [a + b for a in tokens for b in tokens]
+        samples.append("".join(tokens))
+
+        for text in samples:
+            found = scanner.scan(text)
+            assert found == fallback.scan(text), repr(text)
+            assert found == scanner.scan(text.encode("utf-8")), repr(text)
+
+        assert scanner.scan("abc") == set()
+        assert "null" in scanner.scan("a%00b")
+
 
 class TestInputLengthLimits:
     """Test that all inputs respect length limits"""
@@ -3,18 +3,32 @@ Unit tests for cost protection middleware
 Tests budget enforcement, session tracking, and circuit breaker
 """
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock
+import json
+import time
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 import redis.asyncio as redis
 
 from app.middleware.cost_protection import (
     CostProtectionConfig,
     SessionCostTracker,
+    WARN_BUDGET,
+    WARN_DURATION,
+    WarningFlags,
     get_cost_config,
     get_cost_tracker
 )
 
 
+def mock_redis_with_pipeline():
+    """Create an AsyncMock Redis client whose pipeline() queues commands"""
+    mock_redis = AsyncMock()
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipeline
+    pipeline.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipeline)
+    return mock_redis
+
+
 class TestCostProtectionConfig:
     """Test cost protection configuration"""
 
@@ -95,6 +109,43 @@ class TestCostCalculation:
         # Expected: (100k/1M * $3) + (100k/1M * $15) = $0.3 + $1.5 = $1.8
         assert cost == 1.8
 
+    def test_model_id_variants_use_canonical_pricing(self):
+        """Test that provider prefixes and dated snapshots price like the base model"""
+        from app.middleware.cost_protection import normalize_model
+
+        tracker = SessionCostTracker()
+
+        for model_id in ("openai/gpt-5", "gpt-5-2025-08-07", "GPT-5"):
+            assert normalize_model(model_id) == "gpt-5"
+            assert tracker.calculate_cost(model_id, 100_000, 200_000) == 7.0
+
+        assert list(tracker.calculate_cost_batch(
+            ["openai/gpt-5", "unknown-model"], [100_000, 100_000], [200_000, 100_000]
+        )) == [7.0, 1.8]
+
+    def test_model_enum_matches_model_name(self):
+        """Test that Model members are priced the same as their names"""
+        from app.middleware.cost_protection import MODEL_PRICE_INDEX, Model
+
+        tracker = SessionCostTracker()
+
+        for name, model in MODEL_PRICE_INDEX.items():
+            assert tracker.calculate_cost(model, 123_456, 654_321) == \
+                tracker.calculate_cost(name, 123_456, 654_321)
+
+        assert tracker.calculate_cost(Model.GPT_REALTIME, 50_000, 100_000) == 25.0
+
+    def test_repeated_costs_served_from_cache(self):
+        """Test that identical calls are cached and the cache can be cleared"""
+        tracker = SessionCostTracker()
+
+        assert tracker.calculate_cost("gpt-5", 100_000, 200_000) == 7.0
+        assert tracker.calculate_cost("gpt-5", 100_000, 200_000) == 7.0
+        assert tracker._cached_cost.cache_info().hits == 1
+
+        tracker.clear_cost_cache()
+        assert tracker._cached_cost.cache_info().currsize == 0
+
 
 @pytest.mark.asyncio
 class TestSessionTracking:
@@ -157,6 +208,46 @@ class TestSessionTracking:
         assert tracker.session_tokens[session_id]["input"] == 1500
         assert tracker.session_tokens[session_id]["output"] == 3000
 
+    async def test_usage_result_key_access(self):
+        """Test that usage results keep dict-style access without a __dict__"""
+        tracker = SessionCostTracker()
+        session_id = "test-session-003b"
+
+        await tracker.start_session(session_id)
+        usage = await tracker.track_usage(session_id, "gpt-5", 1000, 2000)
+
+        assert not hasattr(usage, "__dict__")
+        assert usage["call_cost"] == usage.call_cost
+        assert usage["warnings"] == ()
+        assert usage.flags == WarningFlags(0)
+        assert usage.get("missing") is None
+        with pytest.raises(KeyError):
+            usage["missing"]
+        assert set(usage.to_dict()) == {
+            "session_id", "model", "input_tokens", "output_tokens",
+            "call_cost", "session_cost", "budget_ok", "remaining_budget_usd",
+            "remaining_duration_seconds", "circuit_breaker_active",
+            "warnings_mask", "warnings",
+        }
+
+    async def test_usage_result_mapping_forms(self):
+        """Test that `in`, dict() and ** work on results as they did on dicts"""
+        tracker = SessionCostTracker()
+        session_id = "test-session-003c"
+
+        await tracker.start_session(session_id)
+        usage = await tracker.track_usage(session_id, "gpt-5", 1000, 2000)
+        status = await tracker.check_budget(session_id, usage.session_cost)
+
+        assert "budget_ok" in usage
+        assert "warnings" in usage
+        assert "missing" not in usage
+        assert 0 not in usage
+        assert dict(usage) == usage.to_dict()
+        assert {**status} == status.to_dict()
+        assert len(status) == len(status.to_dict())
+        assert json.loads(json.dumps(dict(status)))["budget_ok"] is True
+
     async def test_end_session(self):
         """Test session cleanup"""
         tracker = SessionCostTracker()
@@ -228,7 +319,10 @@ class TestBudgetEnforcement:
             output_tokens=100_000   # $3 = total $8
         )
 
-        assert "Session budget limit exceeded" in usage["warnings"]
+        assert WARN_BUDGET in usage["warnings"]
+        assert WARN_BUDGET == "Session budget limit exceeded"
+        assert WarningFlags.BUDGET_EXCEEDED in usage.flags
+        assert WarningFlags.DURATION_EXCEEDED not in usage.flags
 
 
 @pytest.mark.asyncio
@@ -256,13 +350,13 @@ class TestSessionDuration:
         await tracker.start_session(session_id)
 
         # Manually set start time to 31 minutes ago
-        tracker.session_start_times[session_id] = datetime.utcnow() - timedelta(minutes=31)
+        tracker._session_start_monotonic[session_id] = time.monotonic() - 31 * 60
 
         # Check budget (should fail due to duration)
         budget_status = await tracker.check_budget(session_id, 1.0)
 
         assert budget_status["budget_ok"] is False
-        assert "Session duration limit exceeded" in budget_status["warnings"]
+        assert WARN_DURATION in budget_status["warnings"]
 
 
 @pytest.mark.asyncio
@@ -299,7 +393,7 @@ class TestCircuitBreaker:
         await tracker.activate_circuit_breaker()
 
         # Manually set reset time to past
-        tracker.circuit_breaker_reset_time = datetime.utcnow() - timedelta(minutes=1)
+        tracker._circuit_breaker_deadline = time.monotonic() - 60
 
         # Check circuit breaker (should reset)
         await tracker.check_circuit_breaker()
@@ -314,32 +408,49 @@ class TestRedisIntegration:
 
     async def test_session_storage_in_redis(self):
         """Test that session data is stored in Redis"""
-        mock_redis = AsyncMock()
+        mock_redis = mock_redis_with_pipeline()
         tracker = SessionCostTracker(redis_client=mock_redis)
         session_id = "test-session-011"
 
         await tracker.start_session(session_id)
 
-        # Verify Redis calls
-        mock_redis.hset.assert_called_once()
-        mock_redis.expire.assert_called_once()
+        # Verify Redis calls, sent together in one pipeline
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.hset.assert_called_once()
+        pipeline.expire.assert_called_once()
+        pipeline.execute.assert_awaited_once()
 
     async def test_usage_update_in_redis(self):
         """Test that usage updates are persisted to Redis"""
-        mock_redis = AsyncMock()
+        mock_redis = mock_redis_with_pipeline()
         tracker = SessionCostTracker(redis_client=mock_redis)
         session_id = "test-session-012"
 
         await tracker.start_session(session_id)
         await tracker.track_usage(session_id, "gpt-5", 1000, 2000)
 
-        # Should have called hset for start and update
-        assert mock_redis.hset.call_count == 2
+        # Should have called hset for start (pipelined) and update
+        assert mock_redis.pipeline.return_value.hset.call_count == 1
+        assert mock_redis.hset.call_count == 1
+
+    async def test_zero_token_usage_skips_redis(self):
+        """Test that zero-token probes do not write to Redis"""
+        mock_redis = mock_redis_with_pipeline()
+        tracker = SessionCostTracker(redis_client=mock_redis)
+        session_id = "test-session-012b"
+
+        await tracker.start_session(session_id)
+        usage = await tracker.track_usage(session_id, "gpt-5", 0, 0)
+
+        mock_redis.hset.assert_not_called()
+        assert usage["call_cost"] == 0.0
+        assert usage["budget_ok"] is True
 
     async def test_redis_failure_fallback(self):
         """Test that system continues working if Redis fails"""
-        mock_redis = AsyncMock()
+        mock_redis = mock_redis_with_pipeline()
         mock_redis.hset.side_effect = redis.ConnectionError("Connection failed")
+        mock_redis.pipeline.return_value.execute.side_effect = redis.ConnectionError("Connection failed")
 
         tracker = SessionCostTracker(redis_client=mock_redis)
         session_id = "test-session-013"
@@ -56,6 +56,32 @@ class TestRateLimitConfig:
         assert config.enabled is False
         assert config.status_limit == "100/minute"
 
+    def test_config_cached_per_environment(self, monkeypatch):
+        """Test repeat loads reuse the parsed config until the env changes"""
+        get_rate_limit_config.cache_clear()
+        monkeypatch.setenv("RATE_LIMIT_STATUS", "60/minute")
+        first = get_rate_limit_config()
+
+        assert get_rate_limit_config() is first
+
+        monkeypatch.setenv("RATE_LIMIT_STATUS", "90/minute")
+        changed = get_rate_limit_config()
+
+        assert changed is not first
+        assert changed.status_limit == "90/minute"
+
+    def test_cached_config_is_read_only(self):
+        """Test the shared cached config cannot be modified by a caller"""
+        from pydantic import ValidationError
+
+        get_rate_limit_config.cache_clear()
+        config = get_rate_limit_config()
+
+        with pytest.raises(ValidationError):
+            config.status_limit = "1000/minute"
+
+        assert get_rate_limit_config().status_limit == config.status_limit
+
 
 class TestClientIdentification:
     """Test client IP identification for rate limiting"""